@@ -1,5 +1,6 @@
 """VeSync integration."""
 
+import asyncio
 from datetime import timedelta
 import logging
 
@@ -12,10 +13,12 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .common import async_process_devices
 from .const import (
     DOMAIN,
+    ENERGY_UPDATE_INTERVAL,
     SERVICE_UPDATE_DEVS,
     VS_BINARY_SENSORS,
     VS_BUTTON,
@@ -66,6 +69,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     hass.data[DOMAIN] = {config_entry.entry_id: {}}
     hass.data[DOMAIN][config_entry.entry_id][VS_MANAGER] = manager
 
+    # Last energy history fetch per outlet cid
+    energy_fetched = {}
+
     # Create a DataUpdateCoordinator for the manager
     async def async_update_data():
         """Fetch data from API endpoint."""
@@ -73,6 +79,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             await manager.update()
         except Exception as err:
             raise UpdateFailed(f"Update failed: {err}") from err
+        # Energy history is not part of manager.update() and costs several
+        # cloud requests per outlet, so only refresh it for outlets that have
+        # not been fetched within ENERGY_UPDATE_INTERVAL. Fetch them
+        # concurrently so one failing outlet does not block the rest.
+        now = dt_util.utcnow()
+        outlets = [
+            outlet
+            for outlet in manager.devices.outlets
+            if (fetched := energy_fetched.get(outlet.cid)) is None
+            or now - fetched >= ENERGY_UPDATE_INTERVAL
+        ]
+        for outlet in outlets:
+            energy_fetched[outlet.cid] = now
+        results = await asyncio.gather(
+            *(outlet.update_energy() for outlet in outlets), return_exceptions=True
+        )
+        for outlet, result in zip(outlets, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Unable to update energy for %s: %s", outlet.device_name, result
+                )
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -1,6 +1,7 @@
 """Support for power & energy sensors for VeSync outlets."""
 
 import logging
+from functools import partial
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
@@ -24,11 +25,9 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    discover = partial(
+        _setup_entities, async_add_entities=async_add_entities, coordinator=coordinator
+    )
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_BINARY_SENSORS), discover)
     )
@@ -61,7 +60,7 @@ def _setup_entities(devices, async_add_entities, coordinator):
         if has_feature(dev, "filter_open_state"):
             entities.append(VeSyncFilterOpenStateSensor(dev, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class VeSyncairfryerSensor(VeSyncBaseEntity, BinarySensorEntity):
@@ -70,6 +69,8 @@ class VeSyncairfryerSensor(VeSyncBaseEntity, BinarySensorEntity):
     def __init__(self, airfryer, coordinator, stype) -> None:
         """Initialize the VeSync humidifier device."""
         super().__init__(airfryer, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-{stype[0]}"
+        self._attr_name = stype[1]
         self.airfryer = airfryer
         self.stype = stype
 
@@ -78,16 +79,6 @@ class VeSyncairfryerSensor(VeSyncBaseEntity, BinarySensorEntity):
         """Return the diagnostic entity category."""
         return EntityCategory.DIAGNOSTIC
 
-    @property
-    def unique_id(self):
-        """Return unique ID for water tank lifted sensor on device."""
-        return f"{super().unique_id}-" + self.stype[0]
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return self.stype[1]
-
     @property
     def is_on(self) -> bool:
         """Return a value indicating whether the Humidifier's water tank is lifted."""
@@ -116,15 +107,11 @@ class VeSyncBinarySensorEntity(VeSyncBaseEntity, BinarySensorEntity):
 class VeSyncOutOfWaterSensor(VeSyncBinarySensorEntity):
     """Out of Water Sensor."""
 
-    @property
-    def unique_id(self):
-        """Return unique ID for out of water sensor on device."""
-        return f"{super().unique_id}-out_of_water"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} out of water"
+    def __init__(self, device, coordinator) -> None:
+        """Initialize the VeSync device."""
+        super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-out_of_water"
+        self._attr_name = f"{device.device_name} out of water"
 
     @property
     def is_on(self) -> bool:
@@ -135,15 +122,11 @@ class VeSyncOutOfWaterSensor(VeSyncBinarySensorEntity):
 class VeSyncWaterTankLiftedSensor(VeSyncBinarySensorEntity):
     """Tank Lifted Sensor."""
 
-    @property
-    def unique_id(self):
-        """Return unique ID for water tank lifted sensor on device."""
-        return f"{super().unique_id}-water_tank_lifted"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} water tank lifted"
+    def __init__(self, device, coordinator) -> None:
+        """Initialize the VeSync device."""
+        super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-water_tank_lifted"
+        self._attr_name = f"{device.device_name} water tank lifted"
 
     @property
     def is_on(self) -> bool:
@@ -154,15 +137,11 @@ class VeSyncWaterTankLiftedSensor(VeSyncBinarySensorEntity):
 class VeSyncFilterOpenStateSensor(VeSyncBinarySensorEntity):
     """Filter Open Sensor."""
 
-    @property
-    def unique_id(self):
-        """Return unique ID for filter open state sensor on device."""
-        return f"{super().unique_id}-filter-open-state"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} filter open state"
+    def __init__(self, device, coordinator) -> None:
+        """Initialize the VeSync device."""
+        super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-filter-open-state"
+        self._attr_name = f"{device.device_name} filter open state"
 
     @property
     def is_on(self) -> bool:
@@ -1,6 +1,7 @@
 """Support for VeSync button."""
 
 import logging
+from functools import partial
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
@@ -33,11 +34,9 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    discover = partial(
+        _setup_entities, async_add_entities=async_add_entities, coordinator=coordinator
+    )
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_BUTTON), discover)
     )
@@ -64,7 +63,7 @@ def _setup_entities(devices, async_add_entities, coordinator):
                     )
                 )
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class VeSyncairfryerButton(VeSyncBaseEntity, ButtonEntity):
@@ -73,19 +72,11 @@ class VeSyncairfryerButton(VeSyncBaseEntity, ButtonEntity):
     def __init__(self, airfryer, coordinator, stype) -> None:
         """Initialize the VeSync humidifier device."""
         super().__init__(airfryer, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-{stype[0]}"
+        self._attr_name = stype[1]
         self.airfryer = airfryer
         self.stype = stype
 
-    @property
-    def unique_id(self):
-        """Return unique ID for water tank lifted sensor on device."""
-        return f"{super().unique_id}-" + self.stype[0]
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return self.stype[1]
-
     @property
     def icon(self):
         """Return the icon to use in the frontend, if any."""
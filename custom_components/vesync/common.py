@@ -7,6 +7,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
+    TO_REDACT,
     VS_BINARY_SENSORS,
     VS_BUTTON,
     VS_FANS,
@@ -19,6 +20,21 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# pyvesync reports these as plain strings parsed from the API response.
+_STATUS_ON = "on"
+_STATUS_ONLINE = "online"
+
+_VS_PLATFORMS = (
+    VS_SWITCHES,
+    VS_FANS,
+    VS_LIGHTS,
+    VS_SENSORS,
+    VS_HUMIDIFIERS,
+    VS_NUMBERS,
+    VS_BINARY_SENSORS,
+    VS_BUTTON,
+)
+
 
 def has_feature(device, attribute):
     """Return True if the device state has the given attribute with a non-None value."""
@@ -28,86 +44,79 @@ def has_feature(device, attribute):
     return getattr(state, attribute, None) is not None
 
 
-async def async_process_devices(hass, manager):
-    """Assign devices to proper component."""
-    devices = {
-        VS_SWITCHES: [],
-        VS_FANS: [],
-        VS_LIGHTS: [],
-        VS_SENSORS: [],
-        VS_HUMIDIFIERS: [],
-        VS_NUMBERS: [],
-        VS_BINARY_SENSORS: [],
-        VS_BUTTON: [],
-    }
-
-    redacted = async_redact_data(
-        {d.device_name: d.device_type for d in manager.devices},
-        ["cid", "uuid", "mac_id"],
+def _redacted_device_types(devices):
+    """Return a redacted mapping of device names to device types."""
+    return async_redact_data(
+        {d.device_name: d.device_type for d in devices},
+        TO_REDACT,
     )
 
-    _LOGGER.debug(
-        "Found the following devices: %s",
-        redacted,
-    )
 
-    if (
-        not manager.devices.bulbs
-        and not manager.devices.fans
-        and not manager.devices.air_fryers
-        and not manager.devices.outlets
-        and not manager.devices.switches
-        and not manager.devices.humidifiers
-        and not manager.devices.air_purifiers
+async def async_process_devices(hass, manager):
+    """Assign devices to proper component."""
+    devices = {platform: [] for platform in _VS_PLATFORMS}
+
+    md = manager.devices
+    bulbs = md.bulbs
+    fans = md.fans
+    air_fryers = md.air_fryers
+    outlets = md.outlets
+    switches = md.switches
+    humidifiers = md.humidifiers
+    air_purifiers = md.air_purifiers
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Found the following devices: %s",
+            _redacted_device_types(md),
+        )
+
+    if not any(
+        (bulbs, fans, air_fryers, outlets, switches, humidifiers, air_purifiers)
     ):
-        _LOGGER.error("Could not find any device to add in %s", redacted)
-
-    for fan in manager.devices.fans:
-        devices[VS_FANS].append(fan)
-        devices[VS_NUMBERS].append(fan)
-        devices[VS_SWITCHES].append(fan)
-        devices[VS_SENSORS].append(fan)
-        devices[VS_BINARY_SENSORS].append(fan)
-        devices[VS_LIGHTS].append(fan)
-
-    for purifier in manager.devices.air_purifiers:
-        devices[VS_FANS].append(purifier)
-        devices[VS_NUMBERS].append(purifier)
-        devices[VS_SWITCHES].append(purifier)
-        devices[VS_SENSORS].append(purifier)
-        devices[VS_BINARY_SENSORS].append(purifier)
-        devices[VS_LIGHTS].append(purifier)
-
-    for humidifier in manager.devices.humidifiers:
-        devices[VS_HUMIDIFIERS].append(humidifier)
-        devices[VS_NUMBERS].append(humidifier)
-        devices[VS_SWITCHES].append(humidifier)
-        devices[VS_SENSORS].append(humidifier)
-        devices[VS_BINARY_SENSORS].append(humidifier)
-        devices[VS_LIGHTS].append(humidifier)
-
-    if manager.devices.bulbs:
-        devices[VS_LIGHTS].extend(manager.devices.bulbs)
-
-    if manager.devices.outlets:
-        devices[VS_SWITCHES].extend(manager.devices.outlets)
+        _LOGGER.error(
+            "Could not find any device to add in %s", _redacted_device_types(md)
+        )
+        return devices
+
+    vs_switches = devices[VS_SWITCHES]
+    vs_lights = devices[VS_LIGHTS]
+    vs_sensors = devices[VS_SENSORS]
+    vs_binary_sensors = devices[VS_BINARY_SENSORS]
+
+    fans_and_purifiers = list(fans) + list(air_purifiers)
+    fan_like = fans_and_purifiers + list(humidifiers)
+
+    devices[VS_FANS].extend(fans_and_purifiers)
+    devices[VS_HUMIDIFIERS].extend(humidifiers)
+    devices[VS_NUMBERS].extend(fan_like)
+    vs_switches.extend(fan_like)
+    vs_sensors.extend(fan_like)
+    vs_binary_sensors.extend(fan_like)
+    vs_lights.extend(fan_like)
+
+    if bulbs:
+        vs_lights.extend(bulbs)
+
+    if outlets:
+        vs_switches.extend(outlets)
         # Expose outlets' power & energy usage as separate sensors
-        devices[VS_SENSORS].extend(manager.devices.outlets)
+        vs_sensors.extend(outlets)
 
-    for switch in manager.devices.switches:
+    for switch in switches:
         if not switch.supports_dimmable:
-            devices[VS_SWITCHES].append(switch)
+            vs_switches.append(switch)
         else:
-            devices[VS_LIGHTS].append(switch)
+            vs_lights.append(switch)
 
-    for airfryer in manager.devices.air_fryers:
+    for airfryer in air_fryers:
         _LOGGER.warning(
             "Found air fryer %s, support in progress.\n", airfryer.device_name
         )
-        devices[VS_SENSORS].append(airfryer)
-        devices[VS_BINARY_SENSORS].append(airfryer)
-        devices[VS_SWITCHES].append(airfryer)
-        devices[VS_BUTTON].append(airfryer)
+    vs_sensors.extend(air_fryers)
+    vs_binary_sensors.extend(air_fryers)
+    vs_switches.extend(air_fryers)
+    devices[VS_BUTTON].extend(air_fryers)
 
     return devices
 
@@ -119,46 +128,26 @@ class VeSyncBaseEntity(CoordinatorEntity, Entity):
         """Initialize the VeSync device."""
         self.device = device
         super().__init__(coordinator, context=device)
-
-    @property
-    def base_unique_id(self):
-        """Return the ID of this device."""
-        if isinstance(self.device.sub_device_no, int):
-            return f"{self.device.cid}{str(self.device.sub_device_no)}"
-        return self.device.cid
-
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        # The unique_id property may be overridden in subclasses, such as in sensors. Maintaining base_unique_id allows
-        # us to group related entities under a single device.
-        return self.base_unique_id
-
-    @property
-    def base_name(self):
-        """Return the name of the device."""
-        return self.device.device_name
-
-    @property
-    def name(self):
-        """Return the name of the entity (may be overridden)."""
-        return self.base_name
+        sub = device.sub_device_no
+        # Subclasses such as sensors suffix _attr_unique_id; keeping _base_unique_id
+        # allows us to group related entities under a single device.
+        self._base_unique_id = (
+            f"{device.cid}{sub}" if isinstance(sub, int) else device.cid
+        )
+        self._attr_unique_id = self._base_unique_id
+        self._attr_name = device.device_name
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._base_unique_id)},
+            "name": device.device_name,
+            "model": device.device_type,
+            "manufacturer": "VeSync",
+            "sw_version": device.current_firm_version,
+        }
 
     @property
     def available(self) -> bool:
         """Return True if device is available."""
-        return self.device.state.connection_status == "online"
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.base_unique_id)},
-            "name": self.base_name,
-            "model": self.device.device_type,
-            "manufacturer": "VeSync",
-            "sw_version": self.device.current_firm_version,
-        }
+        return self.device.state.connection_status == _STATUS_ONLINE
 
     async def async_added_to_hass(self):
         """When entity is added to hass."""
@@ -170,14 +159,10 @@ class VeSyncBaseEntity(CoordinatorEntity, Entity):
 class VeSyncDevice(VeSyncBaseEntity, ToggleEntity):
     """Base class for VeSync Device Representations."""
 
-    def __init__(self, device, coordinator) -> None:
-        """Initialize the VeSync device."""
-        super().__init__(device, coordinator)
-
     @property
     def is_on(self):
         """Return True if device is on."""
-        return self.device.state.device_status == "on"
+        return self.device.state.device_status == _STATUS_ON
 
     async def async_turn_off(self, **kwargs):
         """Turn the device off."""
@@ -1,5 +1,7 @@
 """Constants for VeSync Component."""
 
+from datetime import timedelta
+
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import UnitOfTemperature, UnitOfTime
 
@@ -18,6 +20,10 @@ VS_NUMBERS = "numbers"
 VS_BINARY_SENSORS = "binary_sensors"
 VS_MANAGER = "manager"
 
+# Outlet energy history takes several cloud requests per outlet, so it is
+# refreshed far less often than the regular coordinator poll.
+ENERGY_UPDATE_INTERVAL = timedelta(minutes=30)
+
 VS_MODE_AUTO = "auto"
 VS_MODE_HUMIDITY = "humidity"
 VS_MODE_MANUAL = "manual"
@@ -26,6 +32,8 @@ VS_MODE_TURBO = "turbo"
 
 VS_TO_HA_ATTRIBUTES = {"humidity": "current_humidity"}
 
+TO_REDACT = frozenset({"cid", "uuid", "mac_id"})
+
 
 DEV_TYPE_TO_HA = {
     "ESL100": "bulb-dimmable",
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
 import voluptuous as vol
 
@@ -97,5 +98,10 @@ async def async_get_action_capabilities(
         )
     except HomeAssistantError:
         available_modes = []
-    fields = {vol.Required(ATTR_MODE): vol.In(available_modes)}
-    return {"extra_fields": vol.Schema(fields)}
+    return {"extra_fields": _mode_schema(tuple(available_modes))}
+
+
+@lru_cache(maxsize=128)
+def _mode_schema(modes: tuple[str, ...]) -> vol.Schema:
+    """Return the set_mode extra fields schema for the given preset modes."""
+    return vol.Schema({vol.Required(ATTR_MODE): vol.In(list(modes))})
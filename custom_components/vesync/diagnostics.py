@@ -9,8 +9,7 @@ from homeassistant.core import HomeAssistant
 
 # from .common import is_humidifier
 # from .const import DOMAIN
-
-TO_REDACT = {"cid", "uuid", "mac_id"}
+from .const import TO_REDACT
 
 
 async def async_get_config_entry_diagnostics(
@@ -1,6 +1,7 @@
 """Support for VeSync fans."""
 
 import math
+from functools import partial
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
@@ -35,11 +36,9 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    discover = partial(
+        _setup_entities, async_add_entities=async_add_entities, coordinator=coordinator
+    )
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_FANS), discover)
     )
@@ -54,9 +53,7 @@ async def async_setup_entry(
 @callback
 def _setup_entities(devices, async_add_entities, coordinator):
     """Check if device is online and add entity."""
-    async_add_entities(
-        [VeSyncFanHA(dev, coordinator) for dev in devices], update_before_add=True
-    )
+    async_add_entities([VeSyncFanHA(dev, coordinator) for dev in devices])
 
 
 class VeSyncFanHA(VeSyncDevice, FanEntity):
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import partial
 import logging
 from typing import Any
 
@@ -55,11 +56,9 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    discover = partial(
+        _setup_entities, async_add_entities=async_add_entities, coordinator=coordinator
+    )
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_HUMIDIFIERS), discover)
     )
@@ -74,10 +73,7 @@ async def async_setup_entry(
 @callback
 def _setup_entities(devices, async_add_entities, coordinator):
     """Check if device is online and add entity."""
-    async_add_entities(
-        [VeSyncHumidifierHA(dev, coordinator) for dev in devices],
-        update_before_add=True,
-    )
+    async_add_entities([VeSyncHumidifierHA(dev, coordinator) for dev in devices])
 
 
 def _get_ha_mode(vs_mode: str) -> str | None:
@@ -1,5 +1,6 @@
 """Support for VeSync bulbs and wall dimmers."""
 import logging
+from functools import partial
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -29,11 +30,9 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    discover = partial(
+        _setup_entities, async_add_entities=async_add_entities, coordinator=coordinator
+    )
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_LIGHTS), discover)
     )
@@ -57,7 +56,7 @@ def _setup_entities(devices, async_add_entities, coordinator):
         if getattr(dev, "supports_nightlight", False):
             entities.append(VeSyncNightLightHA(dev, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 def _vesync_brightness_to_ha(vesync_brightness):
@@ -218,21 +217,13 @@ class VeSyncNightLightHA(VeSyncDimmableLightHA):
     def __init__(self, device, coordinator) -> None:
         """Initialize the VeSync device."""
         super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-night-light"
+        self._attr_name = f"{device.device_name} night light"
         self.device = device
         self.has_brightness = getattr(
             self.device, "supports_nightlight_brightness", False
         )
 
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return f"{super().unique_id}-night-light"
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{super().name} night light"
-
     @property
     def brightness(self):
         """Get night light brightness."""
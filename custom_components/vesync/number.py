@@ -1,5 +1,7 @@
 """Support for number settings on VeSync devices."""
 
+from functools import partial
+
 from homeassistant.components.number import NumberEntity
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
@@ -25,11 +27,9 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    discover = partial(
+        _setup_entities, async_add_entities=async_add_entities, coordinator=coordinator
+    )
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_NUMBERS), discover)
     )
@@ -55,7 +55,7 @@ def _setup_entities(devices, async_add_entities, coordinator):
         if hasattr(dev, "fan_levels") and dev.fan_levels:
             entities.append(VeSyncFanSpeedLevelHA(dev, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class VeSyncNumberEntity(VeSyncBaseEntity, NumberEntity):
@@ -77,20 +77,12 @@ class VeSyncFanSpeedLevelHA(VeSyncNumberEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the number entity."""
         super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-fan-speed-level"
+        self._attr_name = f"{device.device_name} fan speed level"
         self._attr_native_min_value = device.fan_levels[0]
         self._attr_native_max_value = device.fan_levels[-1]
         self._attr_native_step = 1
 
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return f"{super().unique_id}-fan-speed-level"
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{super().name} fan speed level"
-
     @property
     def native_value(self):
         """Return the fan speed level."""
@@ -112,20 +104,12 @@ class VeSyncHumidifierMistLevelHA(VeSyncNumberEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the number entity."""
         super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-mist-level"
+        self._attr_name = f"{device.device_name} mist level"
         self._attr_native_min_value = device.mist_levels[0]
         self._attr_native_max_value = device.mist_levels[-1]
         self._attr_native_step = 1
 
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return f"{super().unique_id}-mist-level"
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{super().name} mist level"
-
     @property
     def native_value(self):
         """Return the mist level."""
@@ -147,20 +131,12 @@ class VeSyncHumidifierWarmthLevelHA(VeSyncNumberEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the number entity."""
         super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-warm-mist"
+        self._attr_name = f"{device.device_name} warm mist"
         self._attr_native_min_value = device.warm_mist_levels[0]
         self._attr_native_max_value = device.warm_mist_levels[-1]
         self._attr_native_step = 1
 
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return f"{super().unique_id}-warm-mist"
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{super().name} warm mist"
-
     @property
     def native_value(self):
         """Return the warmth level."""
@@ -182,20 +158,12 @@ class VeSyncHumidifierTargetLevelHA(VeSyncNumberEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the number entity."""
         super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-target-level"
+        self._attr_name = f"{device.device_name} target level"
         self._attr_native_min_value = MIN_HUMIDITY
         self._attr_native_max_value = MAX_HUMIDITY
         self._attr_native_step = 1
 
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return f"{super().unique_id}-target-level"
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{super().name} target level"
-
     @property
     def native_value(self):
         """Return the current target humidity level."""
@@ -1,6 +1,7 @@
 """Support for power & energy sensors for VeSync outlets."""
 
 import logging
+from functools import partial
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -41,11 +42,9 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    discover = partial(
+        _setup_entities, async_add_entities=async_add_entities, coordinator=coordinator
+    )
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_SENSORS), discover)
     )
@@ -96,7 +95,7 @@ def _setup_entities(devices, async_add_entities, coordinator):
         if has_feature(dev, "fan_rotate_angle"):
             entities.append(VeSyncFanRotateAngleSensor(dev, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class VeSyncairfryerSensor(VeSyncBaseEntity, SensorEntity):
@@ -105,19 +104,11 @@ class VeSyncairfryerSensor(VeSyncBaseEntity, SensorEntity):
     def __init__(self, airfryer, coordinator, stype) -> None:
         """Initialize the VeSync airfryer."""
         super().__init__(airfryer, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-{stype[0]}"
+        self._attr_name = stype[1]
         self.airfryer = airfryer
         self.stype = stype
 
-    @property
-    def unique_id(self):
-        """Return unique ID for power sensor on device."""
-        return f"{super().unique_id}-" + self.stype[0]
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return self.stype[1]
-
     @property
     def device_class(self):
         """Return the class."""
@@ -160,16 +151,8 @@ class VeSyncPowerSensor(VeSyncOutletSensorEntity):
     def __init__(self, plug, coordinator) -> None:
         """Initialize the VeSync outlet device."""
         super().__init__(plug, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return unique ID for power sensor on device."""
-        return f"{super().unique_id}-power"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} current power"
+        self._attr_unique_id = f"{self._base_unique_id}-power"
+        self._attr_name = f"{plug.device_name} current power"
 
     @property
     def device_class(self):
@@ -203,18 +186,10 @@ class VeSyncEnergySensor(VeSyncOutletSensorEntity):
     def __init__(self, plug, coordinator) -> None:
         """Initialize the VeSync outlet device."""
         super().__init__(plug, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-energy"
+        self._attr_name = f"{plug.device_name} energy use today"
         self.smartplug = plug
 
-    @property
-    def unique_id(self):
-        """Return unique ID for power sensor on device."""
-        return f"{super().unique_id}-energy"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} energy use today"
-
     @property
     def device_class(self):
         """Return the energy device class."""
@@ -263,6 +238,8 @@ class VeSyncAirQualitySensor(VeSyncHumidifierSensorEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the VeSync device."""
         super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-air-quality"
+        self._attr_name = f"{device.device_name} air quality"
         self._numeric_quality = None
         if self.native_value is not None:
             self._numeric_quality = isinstance(self.native_value, (int, float))
@@ -272,16 +249,6 @@ class VeSyncAirQualitySensor(VeSyncHumidifierSensorEntity):
         """Return the air quality device class."""
         return SensorDeviceClass.AQI if self._numeric_quality else None
 
-    @property
-    def unique_id(self):
-        """Return unique ID for air quality sensor on device."""
-        return f"{super().unique_id}-air-quality"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} air quality"
-
     @property
     def native_value(self):
         """Return the air quality index."""
@@ -306,20 +273,12 @@ class VeSyncAirQualityPercSensor(VeSyncHumidifierSensorEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the VeSync device."""
         super().__init__(device, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-air-quality-perc"
+        self._attr_name = f"{device.device_name} air quality percentage"
         self._numeric_quality = None
         if self.native_value is not None:
             self._numeric_quality = isinstance(self.native_value, (int, float))
 
-    @property
-    def unique_id(self):
-        """Return unique ID for air quality sensor on device."""
-        return f"{super().unique_id}-air-quality-perc"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} air quality percentage"
-
     @property
     def native_unit_of_measurement(self):
         """Return the % unit of measurement."""
@@ -351,16 +310,8 @@ class VeSyncAirQualityValueSensor(VeSyncHumidifierSensorEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the VeSync device."""
         super().__init__(device, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return unique ID for air quality sensor on device."""
-        return f"{super().unique_id}-air-quality-value"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} air quality value"
+        self._attr_unique_id = f"{self._base_unique_id}-air-quality-value"
+        self._attr_name = f"{device.device_name} air quality value"
 
     @property
     def native_value(self):
@@ -388,16 +339,8 @@ class VeSyncPM1Sensor(VeSyncHumidifierSensorEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the VeSync device."""
         super().__init__(device, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return unique ID for PM1 sensor on device."""
-        return f"{super().unique_id}-pm1"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} PM1"
+        self._attr_unique_id = f"{self._base_unique_id}-pm1"
+        self._attr_name = f"{device.device_name} PM1"
 
     @property
     def native_value(self):
@@ -425,16 +368,8 @@ class VeSyncPM10Sensor(VeSyncHumidifierSensorEntity):
     def __init__(self, device, coordinator) -> None:
         """Initialize the VeSync device."""
         super().__init__(device, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return unique ID for PM10 sensor on device."""
-        return f"{super().unique_id}-pm10"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} PM10"
+        self._attr_unique_id = f"{self._base_unique_id}-pm10"
+        self._attr_name = f"{device.device_name} PM10"
 
     @property
     def native_value(self):
@@ -458,22 +393,14 @@ class VeSyncFilterLifeSensor(VeSyncHumidifierSensorEntity):
     def __init__(self, plug, coordinator) -> None:
         """Initialize the VeSync device."""
         super().__init__(plug, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-filter-life"
+        self._attr_name = f"{plug.device_name} filter life"
 
     @property
     def entity_category(self):
         """Return the diagnostic entity category."""
         return EntityCategory.DIAGNOSTIC
 
-    @property
-    def unique_id(self):
-        """Return unique ID for filter life sensor on device."""
-        return f"{super().unique_id}-filter-life"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} filter life"
-
     @property
     def device_class(self):
         """Return the filter life device class."""
@@ -511,22 +438,14 @@ class VeSyncFanRotateAngleSensor(VeSyncHumidifierSensorEntity):
     def __init__(self, plug, coordinator) -> None:
         """Initialize the VeSync device."""
         super().__init__(plug, coordinator)
+        self._attr_unique_id = f"{self._base_unique_id}-fan-rotate-angle"
+        self._attr_name = f"{plug.device_name} fan rotate angle"
 
     @property
     def entity_category(self):
         """Return the diagnostic entity category."""
         return EntityCategory.DIAGNOSTIC
 
-    @property
-    def unique_id(self):
-        """Return unique ID for filter life sensor on device."""
-        return f"{super().unique_id}-fan-rotate-angle"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} fan rotate angle"
-
     @property
     def device_class(self):
         """Return the fan rotate angle device class."""
@@ -559,16 +478,8 @@ class VeSyncHumiditySensor(VeSyncHumidifierSensorEntity):
     def __init__(self, humidity, coordinator) -> None:
         """Initialize the VeSync outlet device."""
         super().__init__(humidity, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return unique ID for humidity sensor on device."""
-        return f"{super().unique_id}-humidity"
-
-    @property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} current humidity"
+        self._attr_unique_id = f"{self._base_unique_id}-humidity"
+        self._attr_name = f"{humidity.device_name} current humidity"
 
     @property
     def device_class(self):
@@ -1,5 +1,6 @@
 """Support for VeSync switches."""
 import logging
+from functools import partial
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
@@ -23,11 +24,9 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    discover = partial(
+        _setup_entities, async_add_entities=async_add_entities, coordinator=coordinator
+    )
     config_entry.async_on_unload(
         async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_SWITCHES), discover)
     )
@@ -43,33 +42,33 @@ async def async_setup_entry(
 def _setup_entities(devices, async_add_entities, coordinator):
     """Check if device is online and add entity."""
     entities = []
+    append = entities.append
+    ha_type_for = DEV_TYPE_TO_HA.get
     for dev in devices:
-        if DEV_TYPE_TO_HA.get(dev.device_type) == "outlet":
-            entities.append(VeSyncSwitchHA(dev, coordinator))
-        if DEV_TYPE_TO_HA.get(dev.device_type) == "switch":
-            entities.append(VeSyncLightSwitch(dev, coordinator))
-        if getattr(dev, "set_auto_mode", None):
-            entities.append(VeSyncHumidifierAutoOnHA(dev, coordinator))
-        if getattr(dev, "turn_on_automatic_stop", None):
-            entities.append(VeSyncHumidifierAutomaticStopHA(dev, coordinator))
-        if getattr(dev, "turn_on_display", None):
-            entities.append(VeSyncHumidifierDisplayHA(dev, coordinator))
-        if getattr(dev, "turn_on_child_lock", None):
-            entities.append(VeSyncFanChildLockHA(dev, coordinator))
-
-    async_add_entities(entities, update_before_add=True)
+        ha_type = ha_type_for(dev.device_type)
+        if ha_type == "outlet":
+            append(VeSyncSwitchHA(dev, coordinator))
+        elif ha_type == "switch":
+            append(VeSyncLightSwitch(dev, coordinator))
+        for attr, cls in _CAPABILITY_SWITCHES:
+            if getattr(dev, attr, None):
+                append(cls(dev, coordinator))
+
+    async_add_entities(entities)
 
 
 class VeSyncBaseSwitch(VeSyncDevice, SwitchEntity):
     """Base class for VeSync switch Device Representations."""
 
-    def __init__(self, plug, coordinator) -> None:
-        """Initialize the VeSync outlet device."""
-        super().__init__(plug, coordinator)
-
     async def async_turn_on(self, **kwargs):
         """Turn the device on."""
         await self.device.turn_on()
+        self.schedule_update_ha_state()
+
+    async def async_turn_off(self, **kwargs):
+        """Turn the device off."""
+        await self.device.turn_off()
+        self.schedule_update_ha_state()
 
 
 class VeSyncSwitchHA(VeSyncBaseSwitch, SwitchEntity):
@@ -78,43 +77,36 @@ class VeSyncSwitchHA(VeSyncBaseSwitch, SwitchEntity):
     def __init__(self, plug, coordinator) -> None:
         """Initialize the VeSync switch device."""
         super().__init__(plug, coordinator)
-        self.smartplug = plug
+        # Energy fields are part of the outlet's state class, so their presence
+        # does not change between updates.
+        self._has_energy = hasattr(plug.state, "weekly_history")
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the device."""
-        if hasattr(self.smartplug.state, "weekly_history"):
-            return {
-                "voltage": self.smartplug.state.voltage,
-                "weekly_energy_total": self.smartplug.state.weekly_history,
-                "monthly_energy_total": self.smartplug.state.monthly_history,
-                "yearly_energy_total": self.smartplug.state.yearly_history,
-            }
-        return {}
+        if not self._has_energy:
+            return {}
+        state = self.device.state
+        return {
+            "voltage": state.voltage,
+            "weekly_energy_total": state.weekly_history,
+            "monthly_energy_total": state.monthly_history,
+            "yearly_energy_total": state.yearly_history,
+        }
 
     async def async_update(self):
         """Update outlet details and energy usage."""
-        await self.smartplug.update()
-        await self.smartplug.update_energy()
+        await self.device.update()
+        await self.device.update_energy()
 
 
 class VeSyncLightSwitch(VeSyncBaseSwitch, SwitchEntity):
     """Handle representation of VeSync Light Switch."""
 
-    def __init__(self, switch, coordinator) -> None:
-        """Initialize Light Switch device class."""
-        super().__init__(switch, coordinator)
-        self.switch = switch
-
 
 class VeSyncSwitchEntity(VeSyncBaseEntity, SwitchEntity):
     """Representation of a switch for configuring a VeSync humidifier."""
 
-    def __init__(self, humidifier, coordinator) -> None:
-        """Initialize the VeSync humidifier device."""
-        super().__init__(humidifier, coordinator)
-        self.smarthumidifier = humidifier
-
     @property
     def entity_category(self):
         """Return the configuration entity category."""
@@ -127,16 +119,8 @@ class VeSyncFanChildLockHA(VeSyncSwitchEntity):
     def __init__(self, lock, coordinator) -> None:
         """Initialize the VeSync outlet device."""
         super().__init__(lock, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return the ID of this display."""
-        return f"{super().unique_id}-child-lock"
-
-    @property
-    def name(self):
-        """Return the name of the entity."""
-        return f"{super().name} child lock"
+        self._attr_unique_id = f"{self._base_unique_id}-child-lock"
+        self._attr_name = f"{lock.device_name} child lock"
 
     @property
     def is_on(self):
@@ -146,10 +130,12 @@ class VeSyncFanChildLockHA(VeSyncSwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the lock on."""
         await self.device.turn_on_child_lock()
+        self.schedule_update_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the lock off."""
         await self.device.turn_off_child_lock()
+        self.schedule_update_ha_state()
 
 
 class VeSyncHumidifierDisplayHA(VeSyncSwitchEntity):
@@ -158,16 +144,8 @@ class VeSyncHumidifierDisplayHA(VeSyncSwitchEntity):
     def __init__(self, lock, coordinator) -> None:
         """Initialize the VeSync outlet device."""
         super().__init__(lock, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return the ID of this display."""
-        return f"{super().unique_id}-display"
-
-    @property
-    def name(self):
-        """Return the name of the entity."""
-        return f"{super().name} display"
+        self._attr_unique_id = f"{self._base_unique_id}-display"
+        self._attr_name = f"{lock.device_name} display"
 
     @property
     def is_on(self):
@@ -177,10 +155,12 @@ class VeSyncHumidifierDisplayHA(VeSyncSwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the display on."""
         await self.device.turn_on_display()
+        self.schedule_update_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the display off."""
         await self.device.turn_off_display()
+        self.schedule_update_ha_state()
 
 
 class VeSyncHumidifierAutomaticStopHA(VeSyncSwitchEntity):
@@ -189,16 +169,8 @@ class VeSyncHumidifierAutomaticStopHA(VeSyncSwitchEntity):
     def __init__(self, automatic, coordinator) -> None:
         """Initialize the VeSync outlet device."""
         super().__init__(automatic, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return f"{super().unique_id}-automatic-stop"
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{super().name} automatic stop"
+        self._attr_unique_id = f"{self._base_unique_id}-automatic-stop"
+        self._attr_name = f"{automatic.device_name} automatic stop"
 
     @property
     def is_on(self):
@@ -208,10 +180,12 @@ class VeSyncHumidifierAutomaticStopHA(VeSyncSwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the automatic stop on."""
         await self.device.turn_on_automatic_stop()
+        self.schedule_update_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the automatic stop off."""
         await self.device.turn_off_automatic_stop()
+        self.schedule_update_ha_state()
 
 
 class VeSyncHumidifierAutoOnHA(VeSyncSwitchEntity):
@@ -220,16 +194,8 @@ class VeSyncHumidifierAutoOnHA(VeSyncSwitchEntity):
     def __init__(self, autooff, coordinator) -> None:
         """Initialize the VeSync outlet device."""
         super().__init__(autooff, coordinator)
-
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return f"{super().unique_id}-auto-mode"
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{super().name} auto mode"
+        self._attr_unique_id = f"{self._base_unique_id}-auto-mode"
+        self._attr_name = f"{autooff.device_name} auto mode"
 
     @property
     def is_on(self):
@@ -239,8 +205,21 @@ class VeSyncHumidifierAutoOnHA(VeSyncSwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn auto mode on."""
         await self.device.set_auto_mode()
+        self.schedule_update_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn auto off by setting manual and mist level 1."""
+        # Kept sequential: both calls target the same device and the mist
+        # level is only meaningful once it has left auto mode.
         await self.device.set_manual_mode()
         await self.device.set_mist_level(1)
+        self.schedule_update_ha_state()
+
+
+# Config switches created for any device exposing the matching capability.
+_CAPABILITY_SWITCHES = (
+    ("set_auto_mode", VeSyncHumidifierAutoOnHA),
+    ("turn_on_automatic_stop", VeSyncHumidifierAutomaticStopHA),
+    ("turn_on_display", VeSyncHumidifierDisplayHA),
+    ("turn_on_child_lock", VeSyncFanChildLockHA),
+)
@@ -1,11 +1,16 @@
 """Shared fixtures for VeSync tests."""
 
 import sys
+from importlib import import_module
+from itertools import chain
+from types import MappingProxyType, ModuleType, SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.helpers.entity import Entity
+from homeassistant.loader import DATA_CUSTOM_COMPONENTS, DATA_INTEGRATIONS
 
 from custom_components.vesync.const import DOMAIN
 
@@ -17,7 +22,7 @@ from custom_components.vesync.const import DOMAIN
 if "homeassistant.components.dhcp" not in sys.modules:
     from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
 
-    _dhcp_stub = MagicMock()
+    _dhcp_stub = ModuleType("homeassistant.components.dhcp")
     _dhcp_stub.DhcpServiceInfo = DhcpServiceInfo
     sys.modules["homeassistant.components.dhcp"] = _dhcp_stub
 
@@ -27,14 +32,27 @@ if "homeassistant.components.dhcp" not in sys.modules:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(autouse=True)
-def _patch_schedule_update(monkeypatch):
+@pytest.fixture(scope="session", autouse=True)
+def _patch_schedule_update():
     """Prevent schedule_update_ha_state from requiring a running event loop."""
-    from homeassistant.helpers.entity import Entity
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(Entity, "schedule_update_ha_state", lambda self: None)
+        yield
+
+
+# ---------------------------------------------------------------------------
+# Keep benchmarks out of the default run
+# ---------------------------------------------------------------------------
 
-    monkeypatch.setattr(
-        Entity, "schedule_update_ha_state", lambda self: None
-    )
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect perf-marked benchmarks unless --benchmark-only is given."""
+    if config.getoption("benchmark_only", default=False):
+        return
+    deselected = [item for item in items if item.get_closest_marker("perf")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not item.get_closest_marker("perf")]
 
 
 # ---------------------------------------------------------------------------
@@ -46,16 +64,31 @@ def _patch_schedule_update(monkeypatch):
 @pytest.fixture(autouse=True)
 def _ensure_custom_integration(hass):
     """Clear the DATA_CUSTOM_COMPONENTS cache so our custom integration wins."""
-    from homeassistant.loader import (
-        DATA_CUSTOM_COMPONENTS,
-        DATA_INTEGRATIONS,
-    )
-
     # Remove any stale cached empty dict or bundled integration entry
     hass.data.pop(DATA_CUSTOM_COMPONENTS, None)
     hass.data.get(DATA_INTEGRATIONS, {}).pop(DOMAIN, None)
 
 
+_PLATFORM_MODULES = (
+    "common",
+    "binary_sensor",
+    "button",
+    "fan",
+    "humidifier",
+    "light",
+    "number",
+    "sensor",
+    "switch",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _import_platform_modules():
+    """Import the integration's platform modules once, before the first test."""
+    for module in _PLATFORM_MODULES:
+        import_module(f"custom_components.vesync.{module}")
+
+
 # ---------------------------------------------------------------------------
 # Mock device factory helpers
 # ---------------------------------------------------------------------------
@@ -93,32 +126,87 @@ def _make_state(connection_status="online", device_status="on", **kwargs):
     return state
 
 
+class _MockDevice:
+    """Plain attribute bag standing in for a pyvesync device.
+
+    Unlike MagicMock, reading an attribute that was not set raises
+    AttributeError, and instances compare and hash by identity.
+    """
+
+    def __init__(self, **attrs):
+        """Set the given attributes on the device."""
+        self.__dict__.update(attrs)
+
+
 def _make_mock(attrs, extras=None, state=None):
-    """Create a MagicMock with given attrs dict applied."""
-    mock = MagicMock()
-    for k, v in attrs.items():
-        setattr(mock, k, v)
-    if extras:
-        for k, v in extras.items():
-            setattr(mock, k, v)
+    """Create a mock device with given attrs dict applied."""
+    mock = _MockDevice(**attrs, **(extras or {}))
     if state is not None:
         mock.state = state
     return mock
 
 
+# Per-device base attributes, built once; _make_mock only reads them.
+_OUTLET_ATTRS = _base_device_attrs(
+    device_name="TestOutlet", device_type="ESW15-USA", cid="outlet-cid"
+)
+_BULB_DIMMABLE_ATTRS = _base_device_attrs(
+    device_name="TestBulb", device_type="ESL100", cid="bulb-cid"
+)
+_BULB_TUNABLE_ATTRS = _base_device_attrs(
+    device_name="TestTunableBulb", device_type="ESL100CW", cid="tunable-cid"
+)
+_WALL_SWITCH_ATTRS = _base_device_attrs(
+    device_name="TestWallSwitch", device_type="ESWL01", cid="wall-switch-cid"
+)
+_DIMMER_ATTRS = _base_device_attrs(
+    device_name="TestDimmer", device_type="ESWD16", cid="dimmer-cid"
+)
+_FAN_ATTRS = _base_device_attrs(
+    device_name="TestFan", device_type="LAP-C201S-AUSR", cid="fan-cid"
+)
+_HUMIDIFIER_ATTRS = _base_device_attrs(
+    device_name="TestHumidifier", device_type="LUH-D301S-WEU", cid="humidifier-cid"
+)
+_NIGHTLIGHT_HUMIDIFIER_ATTRS = _base_device_attrs(
+    device_name="Humidifier", device_type="LUH-D301S-WEU", cid="test"
+)
+_AIRFRYER_ATTRS = _base_device_attrs(
+    device_name="TestAirFryer", device_type="CS158", cid="airfryer-cid"
+)
+
+
+# Read-only humidifier configuration shared by every mock_humidifier_device.
+_HUMIDIFIER_STATE = MappingProxyType(
+    {
+        "mode": "auto",
+        "humidity": 55,
+        "mist_virtual_level": 3,
+        "mist_level": 3,
+        "warm_mist_level": 0,
+        "water_lacks": False,
+        "water_tank_lifted": False,
+        "display_status": True,
+        "child_lock": False,
+        "auto_target_humidity": 55,
+        "automatic_stop": True,
+    }
+)
+_HUMIDIFIER_MIST_MODES = MappingProxyType(
+    {"auto": "auto", "humidity": "humidity", "manual": "manual", "sleep": "sleep"}
+)
+_HUMIDIFIER_MIST_LEVELS = (1, 2, 3, 4, 5, 6, 7, 8, 9)
+_HUMIDIFIER_WARM_MIST_LEVELS = (0, 1, 2, 3)
+
+
 # ---------------------------------------------------------------------------
 # Individual mock-device fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def mock_outlet_device():
+def _make_outlet_device():
     """Return a mock VeSync outlet device."""
-    attrs = _base_device_attrs(
-        device_name="TestOutlet",
-        device_type="ESW15-USA",
-        cid="outlet-cid",
-    )
+    attrs = _OUTLET_ATTRS
     state = _make_state(
         power=15.5,
         voltage=120.0,
@@ -137,14 +225,26 @@ def mock_outlet_device():
     return _make_mock(attrs, extras, state=state)
 
 
+@pytest.fixture
+def mock_outlet_device():
+    """Return a mock VeSync outlet device."""
+    return _make_outlet_device()
+
+
+@pytest.fixture(scope="class")
+def class_outlet_device():
+    """Return a mock VeSync outlet device shared by every test in a class.
+
+    Only for tests that read from the outlet; use mock_outlet_device when a
+    test changes state or asserts on calls.
+    """
+    return _make_outlet_device()
+
+
 @pytest.fixture
 def mock_bulb_dimmable_device():
     """Return a mock VeSync dimmable bulb device."""
-    attrs = _base_device_attrs(
-        device_name="TestBulb",
-        device_type="ESL100",
-        cid="bulb-cid",
-    )
+    attrs = _BULB_DIMMABLE_ATTRS
     state = _make_state(
         brightness=75,
     )
@@ -160,11 +260,7 @@ def mock_bulb_dimmable_device():
 @pytest.fixture
 def mock_bulb_tunable_device():
     """Return a mock VeSync tunable white bulb device."""
-    attrs = _base_device_attrs(
-        device_name="TestTunableBulb",
-        device_type="ESL100CW",
-        cid="tunable-cid",
-    )
+    attrs = _BULB_TUNABLE_ATTRS
     state = _make_state(
         brightness=80,
         color_temp=50,
@@ -182,11 +278,7 @@ def mock_bulb_tunable_device():
 @pytest.fixture
 def mock_wall_switch_device():
     """Return a mock VeSync wall switch device (non-dimmable)."""
-    attrs = _base_device_attrs(
-        device_name="TestWallSwitch",
-        device_type="ESWL01",
-        cid="wall-switch-cid",
-    )
+    attrs = _WALL_SWITCH_ATTRS
     state = _make_state()
     extras = {
         "product_type": "switch",
@@ -200,11 +292,7 @@ def mock_wall_switch_device():
 @pytest.fixture
 def mock_dimmer_device():
     """Return a mock VeSync wall dimmer device."""
-    attrs = _base_device_attrs(
-        device_name="TestDimmer",
-        device_type="ESWD16",
-        cid="dimmer-cid",
-    )
+    attrs = _DIMMER_ATTRS
     state = _make_state(
         brightness=60,
     )
@@ -221,11 +309,7 @@ def mock_dimmer_device():
 @pytest.fixture
 def mock_fan_device():
     """Return a mock VeSync fan device."""
-    attrs = _base_device_attrs(
-        device_name="TestFan",
-        device_type="LAP-C201S-AUSR",
-        cid="fan-cid",
-    )
+    attrs = _FAN_ATTRS
     state = _make_state(
         fan_level=2,
         mode="manual",
@@ -254,46 +338,40 @@ def mock_fan_device():
     return _make_mock(attrs, extras, state=state)
 
 
+# Fans that are only constructed and inspected, never driven, so a single
+# instance of each is shared by the whole session.
+@pytest.fixture(scope="session")
+def single_speed_fan_device():
+    """Return a fan device that reports a single speed level."""
+    return _make_mock(
+        _base_device_attrs(device_name="Test", device_type="TestFan", cid="test"),
+        {"fan_levels": [1], "modes": []},
+    )
+
+
+@pytest.fixture(scope="session")
+def lv_pur131s_fan_device():
+    """Return an LV-PUR131S purifier that reports no fan levels."""
+    return _make_mock(
+        _base_device_attrs(
+            device_name="Purifier", device_type="LV-PUR131S", cid="test"
+        ),
+        {"fan_levels": [], "modes": []},
+    )
+
+
 @pytest.fixture
 def mock_humidifier_device():
     """Return a mock VeSync humidifier device."""
-    attrs = _base_device_attrs(
-        device_name="TestHumidifier",
-        device_type="LUH-D301S-WEU",
-        cid="humidifier-cid",
-    )
-    state = _make_state(
-        mode="auto",
-        humidity=55,
-        mist_virtual_level=3,
-        mist_level=3,
-        warm_mist_level=0,
-        water_lacks=False,
-        water_tank_lifted=False,
-        display_status=True,
-        child_lock=False,
-        auto_target_humidity=55,
-        automatic_stop=True,
-    )
-    state.to_dict = MagicMock(return_value={
-        "mode": "auto",
-        "humidity": 55,
-        "mist_virtual_level": 3,
-        "mist_level": 3,
-        "warm_mist_level": 0,
-        "water_lacks": False,
-        "water_tank_lifted": False,
-        "display_status": True,
-        "child_lock": False,
-        "auto_target_humidity": 55,
-        "automatic_stop": True,
-    })
+    attrs = _HUMIDIFIER_ATTRS
+    state = _make_state(**_HUMIDIFIER_STATE)
+    state.to_dict = MagicMock(return_value=_HUMIDIFIER_STATE)
     extras = {
         "product_type": "humidifier",
         "is_on": True,
-        "mist_modes": {"auto": "auto", "humidity": "humidity", "manual": "manual", "sleep": "sleep"},
-        "mist_levels": [1, 2, 3, 4, 5, 6, 7, 8, 9],
-        "warm_mist_levels": [0, 1, 2, 3],
+        "mist_modes": _HUMIDIFIER_MIST_MODES,
+        "mist_levels": _HUMIDIFIER_MIST_LEVELS,
+        "warm_mist_levels": _HUMIDIFIER_WARM_MIST_LEVELS,
         "supports_nightlight": False,
         "supports_nightlight_brightness": False,
         "turn_on": AsyncMock(return_value=True),
@@ -315,13 +393,22 @@ def mock_humidifier_device():
 
 
 @pytest.fixture
-def mock_airfryer_device():
+def mock_humidifier_nightlight_device():
+    """Return a mock humidifier with a dimmable night light."""
+    state = _make_state(nightlight_brightness=50, nightlight_status="on", brightness=50)
+    extras = {
+        "product_type": "humidifier",
+        "supports_nightlight": True,
+        "supports_nightlight_brightness": True,
+        "set_nightlight_brightness": AsyncMock(),
+        "set_nightlight_mode": AsyncMock(),
+    }
+    return _make_mock(_NIGHTLIGHT_HUMIDIFIER_ATTRS, extras, state=state)
+
+
+def _make_airfryer_device():
     """Return a mock VeSync air fryer device."""
-    attrs = _base_device_attrs(
-        device_name="TestAirFryer",
-        device_type="CS158",
-        cid="airfryer-cid",
-    )
+    attrs = _AIRFRYER_ATTRS
     state = _make_state(
         cook_set_temp=200,
         current_temp=180,
@@ -341,42 +428,73 @@ def mock_airfryer_device():
     return _make_mock(attrs, extras, state=state)
 
 
+@pytest.fixture(scope="class")
+def mock_airfryer_device():
+    """Return a mock VeSync air fryer device.
+
+    Class-scoped: no test changes the fryer's state, so entities built from it
+    can be shared by every test in a class. Tests that assert on the fryer's
+    calls build their own device with _make_airfryer_device.
+    """
+    return _make_airfryer_device()
+
+
 # ---------------------------------------------------------------------------
 # Mock VeSync manager fixture
 # ---------------------------------------------------------------------------
 
 
+class _ManagerDevices(SimpleNamespace):
+    """Plain stand-in for manager.devices, iterable like the real collection."""
+
+    def __iter__(self):
+        """Iterate over every device category (used for logging)."""
+        return chain(
+            self.outlets,
+            self.fans,
+            self.bulbs,
+            self.switches,
+            self.air_fryers,
+            self.humidifiers,
+            self.air_purifiers,
+        )
+
+
+# Shared, immutable stand-in for every device category a test leaves empty.
+_NO_DEVICES = ()
+
+
 def _make_manager_devices(
-    outlets=None,
-    fans=None,
-    bulbs=None,
-    switches=None,
-    air_fryers=None,
-    humidifiers=None,
-    air_purifiers=None,
+    outlets=_NO_DEVICES,
+    fans=_NO_DEVICES,
+    bulbs=_NO_DEVICES,
+    switches=_NO_DEVICES,
+    air_fryers=_NO_DEVICES,
+    humidifiers=_NO_DEVICES,
+    air_purifiers=_NO_DEVICES,
 ):
     """Create a mock manager.devices object."""
-    devices = MagicMock()
-    devices.outlets = outlets or []
-    devices.fans = fans or []
-    devices.bulbs = bulbs or []
-    devices.switches = switches or []
-    devices.air_fryers = air_fryers or []
-    devices.humidifiers = humidifiers or []
-    devices.air_purifiers = air_purifiers or []
-
-    # Make devices iterable (used for logging in async_process_devices)
-    all_devices = (
-        devices.outlets
-        + devices.fans
-        + devices.bulbs
-        + devices.switches
-        + devices.air_fryers
-        + devices.humidifiers
-        + devices.air_purifiers
+    return _ManagerDevices(
+        outlets=outlets,
+        fans=fans,
+        bulbs=bulbs,
+        switches=switches,
+        air_fryers=air_fryers,
+        humidifiers=humidifiers,
+        air_purifiers=air_purifiers,
     )
-    devices.__iter__ = MagicMock(return_value=iter(all_devices))
-    return devices
+
+
+def _make_manager(**devices):
+    """Create a mock VeSync manager holding the given device lists."""
+    manager = MagicMock()
+    manager.account_id = "test-account-id"
+    manager.login = AsyncMock(return_value=True)
+    manager.update = AsyncMock()
+    manager.__aenter__ = AsyncMock(return_value=manager)
+    manager.__aexit__ = AsyncMock(return_value=False)
+    manager.devices = _make_manager_devices(**devices)
+    return manager
 
 
 @pytest.fixture
@@ -387,36 +505,18 @@ def mock_vesync_manager(
     mock_wall_switch_device,
 ):
     """Return a mock VeSync manager with devices attached."""
-    manager = MagicMock()
-    manager.account_id = "test-account-id"
-    manager.login = AsyncMock(return_value=True)
-    manager.update = AsyncMock()
-    manager.__aenter__ = AsyncMock(return_value=manager)
-    manager.__aexit__ = AsyncMock(return_value=False)
-
-    manager.devices = _make_manager_devices(
+    return _make_manager(
         outlets=[mock_outlet_device],
         fans=[mock_fan_device],
         bulbs=[mock_bulb_dimmable_device],
         switches=[mock_wall_switch_device],
     )
 
-    return manager
-
 
 @pytest.fixture
 def mock_empty_manager():
     """Return a mock VeSync manager with no devices."""
-    manager = MagicMock()
-    manager.account_id = "test-account-id"
-    manager.login = AsyncMock(return_value=True)
-    manager.update = AsyncMock()
-    manager.__aenter__ = AsyncMock(return_value=manager)
-    manager.__aexit__ = AsyncMock(return_value=False)
-
-    manager.devices = _make_manager_devices()
-
-    return manager
+    return _make_manager()
 
 
 # ---------------------------------------------------------------------------
@@ -424,22 +524,20 @@ def mock_empty_manager():
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config_entry():
     """Return a mock config entry for VeSync."""
-    from homeassistant.config_entries import ConfigEntry
-
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_id"
-    entry.domain = DOMAIN
-    entry.title = "test@example.com"
-    entry.data = {
-        CONF_USERNAME: "test@example.com",
-        CONF_PASSWORD: "test_password",
-    }
-    entry.options = {}
-    entry.unique_id = "test@example.com-test-account-id"
-    return entry
+    return SimpleNamespace(
+        entry_id="test_entry_id",
+        domain=DOMAIN,
+        title="test@example.com",
+        data={
+            CONF_USERNAME: "test@example.com",
+            CONF_PASSWORD: "test_password",
+        },
+        options={},
+        unique_id="test@example.com-test-account-id",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -447,12 +545,15 @@ def mock_config_entry():
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+_REMOVE_LISTENER = object()
+
+
+@pytest.fixture(scope="session")
 def mock_coordinator():
     """Return a mock DataUpdateCoordinator."""
-    coordinator = MagicMock()
-    coordinator.async_add_listener = MagicMock(return_value=MagicMock())
-    return coordinator
+    return SimpleNamespace(
+        async_add_listener=lambda *args, **kwargs: _REMOVE_LISTENER
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -461,28 +562,17 @@ def mock_coordinator():
 
 
 @pytest.fixture
-def patch_vesync_login():
-    """Patch VeSync.login to succeed."""
-    with patch(
-        "custom_components.vesync.config_flow.VeSync"
-    ) as mock_vesync_class:
-        instance = MagicMock()
-        instance.login = AsyncMock(return_value=True)
-        instance.account_id = "test-account-id"
-        instance.__aenter__ = AsyncMock(return_value=instance)
-        instance.__aexit__ = AsyncMock(return_value=False)
-        mock_vesync_class.return_value = instance
-        yield mock_vesync_class
+def patch_vesync_login(request):
+    """Patch the config flow's VeSync client.
 
-
-@pytest.fixture
-def patch_vesync_login_fail():
-    """Patch VeSync.login to fail."""
+    Login succeeds by default; parametrize indirectly with False to make it fail.
+    """
+    login_result = getattr(request, "param", True)
     with patch(
         "custom_components.vesync.config_flow.VeSync"
     ) as mock_vesync_class:
         instance = MagicMock()
-        instance.login = AsyncMock(return_value=False)
+        instance.login = AsyncMock(return_value=login_result)
         instance.account_id = "test-account-id"
         instance.__aenter__ = AsyncMock(return_value=instance)
         instance.__aexit__ = AsyncMock(return_value=False)
@@ -1,7 +1,5 @@
 """Tests for VeSync binary sensor platform."""
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from homeassistant.helpers.entity import EntityCategory
@@ -20,85 +18,60 @@ from custom_components.vesync.const import BINARY_SENSOR_TYPES_AIRFRYER
 # ---------------------------------------------------------------------------
 
 
-class TestVeSyncOutOfWaterSensor:
-    """Tests for VeSyncOutOfWaterSensor."""
-
-    @pytest.fixture
-    def water_sensor(self, mock_humidifier_device, mock_coordinator):
-        """Return an out-of-water sensor entity."""
-        return VeSyncOutOfWaterSensor(mock_humidifier_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, water_sensor):
-        """Append -out_of_water to unique_id."""
-        assert water_sensor.unique_id.endswith("-out_of_water")
-
-    def test_name_suffix(self, water_sensor):
-        """Append 'out of water' to name."""
-        assert "out of water" in water_sensor.name
-
-    def test_is_on_true(self, water_sensor, mock_humidifier_device):
-        """Return True when water_lacks is True."""
-        mock_humidifier_device.state.water_lacks = True
-        assert water_sensor.is_on is True
-
-    def test_is_on_false(self, water_sensor, mock_humidifier_device):
-        """Return False when water_lacks is False."""
-        mock_humidifier_device.state.water_lacks = False
-        assert water_sensor.is_on is False
-
-    def test_entity_category(self, water_sensor):
-        """Return DIAGNOSTIC entity category."""
-        assert water_sensor.entity_category == EntityCategory.DIAGNOSTIC
-
-
-class TestVeSyncWaterTankLiftedSensor:
-    """Tests for VeSyncWaterTankLiftedSensor."""
-
-    @pytest.fixture
-    def tank_sensor(self, mock_humidifier_device, mock_coordinator):
-        """Return a water tank lifted sensor entity."""
-        return VeSyncWaterTankLiftedSensor(mock_humidifier_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, tank_sensor):
-        """Append -water_tank_lifted to unique_id."""
-        assert tank_sensor.unique_id.endswith("-water_tank_lifted")
-
-    def test_is_on(self, tank_sensor, mock_humidifier_device):
-        """Return water_tank_lifted from device state."""
-        mock_humidifier_device.state.water_tank_lifted = True
-        assert tank_sensor.is_on is True
-
-
-class TestVeSyncFilterOpenStateSensor:
-    """Tests for VeSyncFilterOpenStateSensor."""
-
-    @pytest.fixture
-    def filter_device(self, mock_coordinator):
-        """Return a device with filter_open_state."""
-        device = MagicMock()
-        device.cid = "filter-cid"
-        device.sub_device_no = None
-        device.device_name = "Purifier"
-        device.device_type = "LAP-C201S"
-        device.connection_status = "online"
-        device.current_firm_version = "1.0"
-        state = MagicMock(spec=[])
-        state.filter_open_state = True
-        device.state = state
-        return device
-
-    @pytest.fixture
-    def filter_sensor(self, filter_device, mock_coordinator):
-        """Return a filter open state sensor entity."""
-        return VeSyncFilterOpenStateSensor(filter_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, filter_sensor):
-        """Append -filter-open-state to unique_id."""
-        assert filter_sensor.unique_id.endswith("-filter-open-state")
-
-    def test_is_on(self, filter_sensor, filter_device):
-        """Return filter_open_state from device state."""
-        assert filter_sensor.is_on is True
+HUMIDIFIER_BINARY_SENSORS = [
+    (VeSyncOutOfWaterSensor, "-out_of_water", "out of water", "water_lacks"),
+    (
+        VeSyncWaterTankLiftedSensor,
+        "-water_tank_lifted",
+        "water tank lifted",
+        "water_tank_lifted",
+    ),
+    (
+        VeSyncFilterOpenStateSensor,
+        "-filter-open-state",
+        "filter open state",
+        "filter_open_state",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("sensor_cls", "id_suffix", "name_suffix", "state_attr"),
+    HUMIDIFIER_BINARY_SENSORS,
+)
+class TestVeSyncHumidifierBinarySensors:
+    """Tests for the humidifier diagnostic binary sensors."""
+
+    def test_identity(
+        self,
+        mock_humidifier_device,
+        mock_coordinator,
+        sensor_cls,
+        id_suffix,
+        name_suffix,
+        state_attr,
+    ):
+        """Suffix unique_id and name and use the DIAGNOSTIC category."""
+        sensor = sensor_cls(mock_humidifier_device, mock_coordinator)
+        assert sensor.unique_id.endswith(id_suffix)
+        assert sensor.name == f"TestHumidifier {name_suffix}"
+        assert sensor.entity_category == EntityCategory.DIAGNOSTIC
+
+    @pytest.mark.parametrize("value", [True, False])
+    def test_is_on(
+        self,
+        mock_humidifier_device,
+        mock_coordinator,
+        sensor_cls,
+        id_suffix,
+        name_suffix,
+        state_attr,
+        value,
+    ):
+        """Return the matching device state attribute."""
+        setattr(mock_humidifier_device.state, state_attr, value)
+        sensor = sensor_cls(mock_humidifier_device, mock_coordinator)
+        assert sensor.is_on is value
 
 
 # ---------------------------------------------------------------------------
@@ -109,7 +82,7 @@ class TestVeSyncFilterOpenStateSensor:
 class TestVeSyncAirfryerBinarySensor:
     """Tests for VeSyncairfryerSensor (binary)."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def heating_sensor(self, mock_airfryer_device, mock_coordinator):
         """Return an airfryer is_heating binary sensor."""
         stype = BINARY_SENSOR_TYPES_AIRFRYER["is_heating"]
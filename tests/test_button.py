@@ -6,11 +6,13 @@ import pytest
 
 from custom_components.vesync.button import SENSOR_TYPES_CS158, VeSyncairfryerButton
 
+from .conftest import _make_airfryer_device
+
 
 class TestVeSyncAirfryerButton:
     """Tests for VeSyncairfryerButton entity."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def button_entity(self, mock_airfryer_device, mock_coordinator):
         """Return an airfryer button entity."""
         stype = SENSOR_TYPES_CS158["end"]
@@ -28,7 +30,12 @@ class TestVeSyncAirfryerButton:
         """Return the stop icon."""
         assert button_entity.icon == "mdi:stop"
 
-    async def test_press_calls_end(self, button_entity, mock_airfryer_device):
+    async def test_press_calls_end(self, mock_coordinator):
         """Delegate press to device.end."""
-        await button_entity.async_press()
-        mock_airfryer_device.end.assert_called_once()
+        # A fresh device, so the call count is not shared with other tests.
+        device = _make_airfryer_device()
+        button = VeSyncairfryerButton(
+            device, mock_coordinator, SENSOR_TYPES_CS158["end"]
+        )
+        await button.async_press()
+        device.end.assert_called_once()
@@ -1,6 +1,7 @@
 """Tests for common utilities and base entity classes."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -29,47 +30,24 @@ from .conftest import _make_manager_devices, _make_state
 # ---------------------------------------------------------------------------
 
 
-class TestHasFeature:
-    """Tests for the has_feature helper."""
-
-    def test_returns_true_when_attribute_exists(self):
-        """Return True when the attribute exists on device.state."""
-        device = MagicMock()
-        device.state = MagicMock()
-        device.state.humidity = 55
-        assert has_feature(device, "humidity") is True
-
-    def test_returns_false_when_attribute_missing(self):
-        """Return False when the attribute is absent."""
-        device = MagicMock()
-        device.state = MagicMock(spec=[])
-        assert has_feature(device, "air_quality") is False
-
-    def test_returns_false_when_attribute_is_none(self):
-        """Return False when the attribute value is None."""
-        device = MagicMock()
-        device.state = MagicMock()
-        device.state.humidity = None
-        assert has_feature(device, "humidity") is False
-
-    def test_returns_false_when_state_missing(self):
-        """Return False when the state attribute does not exist on device."""
-        device = MagicMock(spec=[])
-        assert has_feature(device, "humidity") is False
-
-    def test_returns_true_for_zero_value(self):
-        """Return True when the attribute exists but is zero."""
-        device = MagicMock()
-        device.state = MagicMock()
-        device.state.mist_level = 0
-        assert has_feature(device, "mist_level") is True
-
-    def test_returns_true_for_empty_string(self):
-        """Return True when the attribute exists but is an empty string."""
-        device = MagicMock()
-        device.state = MagicMock()
-        device.state.mode = ""
-        assert has_feature(device, "mode") is True
+@pytest.mark.parametrize(
+    ("state", "attribute", "expected"),
+    [
+        pytest.param(SimpleNamespace(humidity=55), "humidity", True, id="present"),
+        pytest.param(SimpleNamespace(), "air_quality", False, id="missing"),
+        pytest.param(SimpleNamespace(humidity=None), "humidity", False, id="none"),
+        pytest.param(SimpleNamespace(mist_level=0), "mist_level", True, id="zero"),
+        pytest.param(SimpleNamespace(mode=""), "mode", True, id="empty-string"),
+    ],
+)
+def test_has_feature(state, attribute, expected):
+    """Return True only when device.state has the attribute with a non-None value."""
+    assert has_feature(SimpleNamespace(state=state), attribute) is expected
+
+
+def test_has_feature_without_state():
+    """Return False when the device has no state attribute."""
+    assert has_feature(object(), "humidity") is False
 
 
 # ---------------------------------------------------------------------------
@@ -77,6 +55,11 @@ class TestHasFeature:
 # ---------------------------------------------------------------------------
 
 
+def _devices_only_manager(**devices):
+    """Return a bare manager exposing only the devices async_process_devices reads."""
+    return SimpleNamespace(devices=_make_manager_devices(**devices))
+
+
 class TestAsyncProcessDevices:
     """Tests for async_process_devices."""
 
@@ -84,10 +67,7 @@ class TestAsyncProcessDevices:
         self, hass, mock_outlet_device
     ):
         """Route outlets to switches and sensors platforms."""
-        manager = MagicMock()
-        manager.devices = _make_manager_devices(
-            outlets=[mock_outlet_device],
-        )
+        manager = _devices_only_manager(outlets=[mock_outlet_device])
 
         result = await async_process_devices(hass, manager)
 
@@ -100,10 +80,7 @@ class TestAsyncProcessDevices:
         self, hass, mock_bulb_dimmable_device
     ):
         """Route bulbs to lights platform."""
-        manager = MagicMock()
-        manager.devices = _make_manager_devices(
-            bulbs=[mock_bulb_dimmable_device],
-        )
+        manager = _devices_only_manager(bulbs=[mock_bulb_dimmable_device])
 
         result = await async_process_devices(hass, manager)
 
@@ -113,10 +90,7 @@ class TestAsyncProcessDevices:
         self, hass, mock_wall_switch_device
     ):
         """Route non-dimmable wall switches to switches platform."""
-        manager = MagicMock()
-        manager.devices = _make_manager_devices(
-            switches=[mock_wall_switch_device],
-        )
+        manager = _devices_only_manager(switches=[mock_wall_switch_device])
 
         result = await async_process_devices(hass, manager)
 
@@ -127,10 +101,7 @@ class TestAsyncProcessDevices:
         self, hass, mock_dimmer_device
     ):
         """Route dimmable wall switches to lights platform."""
-        manager = MagicMock()
-        manager.devices = _make_manager_devices(
-            switches=[mock_dimmer_device],
-        )
+        manager = _devices_only_manager(switches=[mock_dimmer_device])
 
         result = await async_process_devices(hass, manager)
 
@@ -141,10 +112,7 @@ class TestAsyncProcessDevices:
         self, hass, mock_fan_device
     ):
         """Route VeSync fans to fans platform."""
-        manager = MagicMock()
-        manager.devices = _make_manager_devices(
-            fans=[mock_fan_device],
-        )
+        manager = _devices_only_manager(fans=[mock_fan_device])
 
         result = await async_process_devices(hass, manager)
 
@@ -160,10 +128,7 @@ class TestAsyncProcessDevices:
         self, hass, mock_humidifier_device
     ):
         """Route VeSync humidifiers to humidifiers platform."""
-        manager = MagicMock()
-        manager.devices = _make_manager_devices(
-            humidifiers=[mock_humidifier_device],
-        )
+        manager = _devices_only_manager(humidifiers=[mock_humidifier_device])
 
         result = await async_process_devices(hass, manager)
 
@@ -174,10 +139,7 @@ class TestAsyncProcessDevices:
         self, hass, mock_airfryer_device
     ):
         """Route air fryers to sensors, binary_sensors, switches, and buttons."""
-        manager = MagicMock()
-        manager.devices = _make_manager_devices(
-            air_fryers=[mock_airfryer_device],
-        )
+        manager = _devices_only_manager(air_fryers=[mock_airfryer_device])
 
         result = await async_process_devices(hass, manager)
 
@@ -204,34 +166,33 @@ class TestAsyncProcessDevices:
 class TestVeSyncBaseEntity:
     """Tests for VeSyncBaseEntity."""
 
-    def test_unique_id_without_sub_device(self, mock_outlet_device, mock_coordinator):
-        """Return cid as unique_id when sub_device_no is not an int."""
-        mock_outlet_device.sub_device_no = None
-        entity = VeSyncBaseEntity(mock_outlet_device, mock_coordinator)
-        assert entity.unique_id == "outlet-cid"
-
-    def test_unique_id_with_sub_device(self, mock_outlet_device, mock_coordinator):
-        """Return cid + sub_device_no as unique_id."""
-        mock_outlet_device.sub_device_no = 1
+    @pytest.mark.parametrize(
+        ("sub_device_no", "expected"),
+        [(None, "outlet-cid"), (1, "outlet-cid1")],
+    )
+    def test_unique_id(
+        self, mock_outlet_device, mock_coordinator, sub_device_no, expected
+    ):
+        """Return cid, suffixed with sub_device_no when it is an int."""
+        mock_outlet_device.sub_device_no = sub_device_no
         entity = VeSyncBaseEntity(mock_outlet_device, mock_coordinator)
-        assert entity.unique_id == "outlet-cid1"
+        assert entity.unique_id == expected
 
     def test_name_returns_device_name(self, mock_outlet_device, mock_coordinator):
         """Return device_name as entity name."""
         entity = VeSyncBaseEntity(mock_outlet_device, mock_coordinator)
         assert entity.name == "TestOutlet"
 
-    def test_available_when_online(self, mock_outlet_device, mock_coordinator):
-        """Return True when device connection_status is online."""
-        mock_outlet_device.state.connection_status = "online"
-        entity = VeSyncBaseEntity(mock_outlet_device, mock_coordinator)
-        assert entity.available is True
-
-    def test_unavailable_when_offline(self, mock_outlet_device, mock_coordinator):
-        """Return False when device connection_status is offline."""
-        mock_outlet_device.state.connection_status = "offline"
+    @pytest.mark.parametrize(
+        ("connection_status", "expected"), [("online", True), ("offline", False)]
+    )
+    def test_available(
+        self, mock_outlet_device, mock_coordinator, connection_status, expected
+    ):
+        """Return True only when device connection_status is online."""
+        mock_outlet_device.state.connection_status = connection_status
         entity = VeSyncBaseEntity(mock_outlet_device, mock_coordinator)
-        assert entity.available is False
+        assert entity.available is expected
 
     def test_device_info(self, mock_outlet_device, mock_coordinator):
         """Return correct device info dict."""
@@ -251,17 +212,14 @@ class TestVeSyncBaseEntity:
 class TestVeSyncDevice:
     """Tests for VeSyncDevice."""
 
-    def test_is_on_true(self, mock_outlet_device, mock_coordinator):
-        """Return True when device_status is 'on'."""
-        mock_outlet_device.state.device_status = "on"
-        entity = VeSyncDevice(mock_outlet_device, mock_coordinator)
-        assert entity.is_on is True
-
-    def test_is_on_false(self, mock_outlet_device, mock_coordinator):
-        """Return False when device_status is not 'on'."""
-        mock_outlet_device.state.device_status = "off"
+    @pytest.mark.parametrize(
+        ("device_status", "expected"), [("on", True), ("off", False)]
+    )
+    def test_is_on(self, mock_outlet_device, mock_coordinator, device_status, expected):
+        """Return True only when device_status is 'on'."""
+        mock_outlet_device.state.device_status = device_status
         entity = VeSyncDevice(mock_outlet_device, mock_coordinator)
-        assert entity.is_on is False
+        assert entity.is_on is expected
 
     async def test_turn_off_calls_device(self, mock_outlet_device, mock_coordinator):
         """Delegate turn_off to the underlying device."""
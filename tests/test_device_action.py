@@ -1,5 +1,6 @@
 """Tests for VeSync device_action module."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -13,7 +14,7 @@ from homeassistant.const import (
     CONF_ENTITY_ID,
     CONF_TYPE,
 )
-from homeassistant.core import Context, HomeAssistant
+from homeassistant.core import Context, HomeAssistant, ServiceRegistry
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 
@@ -33,59 +34,57 @@ from custom_components.vesync.device_action import (
 class TestAsyncGetActions:
     """Tests for async_get_actions."""
 
-    async def test_returns_set_mode_action_for_fan_entity(self, hass: HomeAssistant):
+    @pytest.fixture
+    def patched_registry(self, monkeypatch):
+        """Return a helper that stubs the entity registry and toggle actions."""
+
+        def _apply(entries, toggle_actions):
+            monkeypatch.setattr(er, "async_get", lambda hass: MagicMock())
+            monkeypatch.setattr(
+                er, "async_entries_for_device", lambda *args, **kwargs: entries
+            )
+            monkeypatch.setattr(
+                "homeassistant.components.device_automation.toggle_entity.async_get_actions",
+                # async_get_actions appends to the returned list, so hand out a copy.
+                AsyncMock(side_effect=lambda *args: list(toggle_actions)),
+            )
+
+        return _apply
+
+    async def test_returns_set_mode_action_for_fan_entity(
+        self, hass: HomeAssistant, patched_registry
+    ):
         """Return a set_mode action for fan entities on the device."""
         device_id = "test_device_id"
 
         # Create a mock entity registry entry for a fan entity
-        fan_entry = MagicMock()
-        fan_entry.domain = "fan"
-        fan_entry.entity_id = "fan.test_fan"
-
-        with (
-            patch.object(er, "async_get") as mock_er_get,
-            patch.object(
-                er, "async_entries_for_device", return_value=[fan_entry]
-            ),
-            patch(
-                "homeassistant.components.device_automation.toggle_entity.async_get_actions",
-                new=AsyncMock(return_value=[]),
-            ),
-        ):
-            mock_er_get.return_value = MagicMock()
-            actions = await async_get_actions(hass, device_id)
+        fan_entry = SimpleNamespace(domain="fan", entity_id="fan.test_fan")
 
-        set_mode_actions = [a for a in actions if a.get(CONF_TYPE) == "set_mode"]
-        assert len(set_mode_actions) == 1
-        assert set_mode_actions[0][CONF_ENTITY_ID] == "fan.test_fan"
-        assert set_mode_actions[0][CONF_DEVICE_ID] == device_id
-        assert set_mode_actions[0][CONF_DOMAIN] == DOMAIN
+        patched_registry([fan_entry], [])
+        actions = await async_get_actions(hass, device_id)
 
-    async def test_skips_non_fan_entities(self, hass: HomeAssistant):
+        set_mode = next((a for a in actions if a.get(CONF_TYPE) == "set_mode"), None)
+        assert set_mode is not None
+        assert set_mode[CONF_ENTITY_ID] == "fan.test_fan"
+        assert set_mode[CONF_DEVICE_ID] == device_id
+        assert set_mode[CONF_DOMAIN] == DOMAIN
+
+    async def test_skips_non_fan_entities(
+        self, hass: HomeAssistant, patched_registry
+    ):
         """Skip entities that are not fans."""
         device_id = "test_device_id"
 
-        switch_entry = MagicMock()
-        switch_entry.domain = "switch"
-        switch_entry.entity_id = "switch.test_switch"
+        switch_entry = SimpleNamespace(domain="switch", entity_id="switch.test_switch")
 
-        with (
-            patch.object(er, "async_get") as mock_er_get,
-            patch.object(
-                er, "async_entries_for_device", return_value=[switch_entry]
-            ),
-            patch(
-                "homeassistant.components.device_automation.toggle_entity.async_get_actions",
-                new=AsyncMock(return_value=[]),
-            ),
-        ):
-            mock_er_get.return_value = MagicMock()
-            actions = await async_get_actions(hass, device_id)
+        patched_registry([switch_entry], [])
+        actions = await async_get_actions(hass, device_id)
 
-        set_mode_actions = [a for a in actions if a.get(CONF_TYPE) == "set_mode"]
-        assert len(set_mode_actions) == 0
+        assert not any(a.get(CONF_TYPE) == "set_mode" for a in actions)
 
-    async def test_includes_toggle_actions(self, hass: HomeAssistant):
+    async def test_includes_toggle_actions(
+        self, hass: HomeAssistant, patched_registry
+    ):
         """Include toggle actions from the base toggle_entity helper."""
         device_id = "test_device_id"
 
@@ -95,18 +94,8 @@ class TestAsyncGetActions:
             CONF_TYPE: "turn_on",
         }
 
-        with (
-            patch.object(er, "async_get") as mock_er_get,
-            patch.object(
-                er, "async_entries_for_device", return_value=[]
-            ),
-            patch(
-                "homeassistant.components.device_automation.toggle_entity.async_get_actions",
-                new=AsyncMock(return_value=[toggle_action]),
-            ),
-        ):
-            mock_er_get.return_value = MagicMock()
-            actions = await async_get_actions(hass, device_id)
+        patched_registry([], [toggle_action])
+        actions = await async_get_actions(hass, device_id)
 
         assert toggle_action in actions
 
@@ -127,19 +116,20 @@ class TestAsyncCallActionFromConfig:
             ATTR_MODE: "auto",
         }
 
-        calls = []
+        context = Context()
 
-        async def mock_service(call):
-            """Track service calls."""
-            calls.append(call)
+        with patch.object(
+            ServiceRegistry, "async_call", new_callable=AsyncMock
+        ) as mock_call:
+            await async_call_action_from_config(hass, config, {}, context)
 
-        hass.services.async_register("fan", "set_preset_mode", mock_service)
-
-        await async_call_action_from_config(hass, config, {}, Context())
-
-        assert len(calls) == 1
-        assert calls[0].data[ATTR_ENTITY_ID] == "fan.test_fan"
-        assert calls[0].data["preset_mode"] == "auto"
+        mock_call.assert_awaited_once_with(
+            "fan",
+            "set_preset_mode",
+            {ATTR_ENTITY_ID: "fan.test_fan", "preset_mode": "auto"},
+            blocking=True,
+            context=context,
+        )
 
     async def test_non_set_mode_delegates_to_toggle(self, hass: HomeAssistant):
         """Delegate non-set_mode actions to toggle_entity helper."""
@@ -150,7 +140,7 @@ class TestAsyncCallActionFromConfig:
 
         with patch(
             "custom_components.vesync.device_action.toggle_entity.async_call_action_from_config",
-            new=AsyncMock(),
+            new_callable=AsyncMock,
         ) as mock_toggle:
             await async_call_action_from_config(hass, config, {}, Context())
 
@@ -222,3 +212,23 @@ class TestAsyncGetActionCapabilities:
             capabilities = await async_get_action_capabilities(hass, config)
 
         assert "extra_fields" in capabilities
+
+    async def test_set_mode_schema_is_reused(self, hass: HomeAssistant):
+        """Reuse one schema per mode list and reject unknown modes."""
+        config = {
+            CONF_TYPE: "set_mode",
+            CONF_ENTITY_ID: "fan.test_fan",
+        }
+
+        with patch(
+            "custom_components.vesync.device_action.get_capability",
+            side_effect=lambda *args: ["auto", "manual", "sleep"],
+        ):
+            first = await async_get_action_capabilities(hass, config)
+            second = await async_get_action_capabilities(hass, config)
+
+        schema = first["extra_fields"]
+        assert second["extra_fields"] is schema
+        assert schema({ATTR_MODE: "sleep"}) == {ATTR_MODE: "sleep"}
+        with pytest.raises(vol.Invalid):
+            schema({ATTR_MODE: "turbo"})
@@ -1,7 +1,7 @@
 """Tests for VeSync fan platform."""
 
 import math
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -19,6 +19,10 @@ from custom_components.vesync.const import (
 )
 from custom_components.vesync.fan import VeSyncFanHA
 
+# Expected values for the mock fan's (1, 3) speed range.
+_EXPECTED_PCT_AT_LEVEL_2 = ranged_value_to_percentage((1, 3), 2)
+_EXPECTED_LEVEL_AT_100 = math.ceil(percentage_to_ranged_value((1, 3), 100))
+
 
 class TestVeSyncFanHA:
     """Tests for VeSyncFanHA entity."""
@@ -48,27 +52,18 @@ class TestVeSyncFanHA:
             FanEntityFeature.SET_SPEED | FanEntityFeature.PRESET_MODE
         )
 
-    def test_supported_features_single_speed(self, mock_coordinator):
+    def test_supported_features_single_speed(
+        self, single_speed_fan_device, mock_coordinator
+    ):
         """Support only SET_SPEED when speed_count is 1."""
-        device = MagicMock()
-        device.device_type = "TestFan"
-        device.fan_levels = [1]
-        device.modes = []
-        device.cid = "test"
-        device.sub_device_no = None
-        device.device_name = "Test"
-        device.connection_status = "online"
-        device.current_firm_version = "1.0"
-
-        fan = VeSyncFanHA(device, mock_coordinator)
+        fan = VeSyncFanHA(single_speed_fan_device, mock_coordinator)
         assert fan.supported_features == FanEntityFeature.SET_SPEED
 
     def test_percentage_in_manual_mode(self, fan_entity, mock_fan_device):
         """Return percentage when in manual mode."""
         mock_fan_device.state.mode = VS_MODE_MANUAL
         mock_fan_device.state.fan_level = 2
-        expected = ranged_value_to_percentage((1, 3), 2)
-        assert fan_entity.percentage == expected
+        assert fan_entity.percentage == _EXPECTED_PCT_AT_LEVEL_2
 
     def test_percentage_none_in_auto_mode(self, fan_entity, mock_fan_device):
         """Return None when not in manual mode."""
@@ -96,70 +91,52 @@ class TestVeSyncFanHA:
         """Set the fan speed to the correct level."""
         mock_fan_device.is_on = True
         await fan_entity.async_set_percentage(100)
-        expected_level = math.ceil(
-            percentage_to_ranged_value((1, 3), 100)
-        )
-        mock_fan_device.set_fan_speed.assert_called_with(expected_level)
-
-    async def test_set_preset_mode_auto(self, fan_entity, mock_fan_device):
-        """Set auto mode on the device."""
-        mock_fan_device.is_on = True
-        await fan_entity.async_set_preset_mode(VS_MODE_AUTO)
-        mock_fan_device.set_auto_mode.assert_called_once()
-
-    async def test_set_preset_mode_sleep(self, fan_entity, mock_fan_device):
-        """Set sleep mode on the device."""
-        mock_fan_device.is_on = True
-        await fan_entity.async_set_preset_mode(VS_MODE_SLEEP)
-        mock_fan_device.set_sleep_mode.assert_called_once()
-
-    async def test_set_preset_mode_manual(self, fan_entity, mock_fan_device):
-        """Set manual mode on the device."""
+        mock_fan_device.set_fan_speed.assert_called_with(_EXPECTED_LEVEL_AT_100)
+
+    @pytest.mark.parametrize(
+        ("mode", "device_method"),
+        [
+            (VS_MODE_AUTO, "set_auto_mode"),
+            (VS_MODE_SLEEP, "set_sleep_mode"),
+            (VS_MODE_MANUAL, "set_manual_mode"),
+        ],
+    )
+    async def test_set_preset_mode(
+        self, fan_entity, mock_fan_device, mode, device_method
+    ):
+        """Set the matching preset mode on the device."""
         mock_fan_device.is_on = True
-        await fan_entity.async_set_preset_mode(VS_MODE_MANUAL)
-        mock_fan_device.set_manual_mode.assert_called_once()
+        await fan_entity.async_set_preset_mode(mode)
+        getattr(mock_fan_device, device_method).assert_called_once()
 
     async def test_set_invalid_preset_mode_raises(self, fan_entity):
         """Raise ValueError for invalid preset mode."""
         with pytest.raises(ValueError):
             await fan_entity.async_set_preset_mode("invalid_mode")
 
-    async def test_turn_on_with_preset_mode(self, fan_entity, mock_fan_device):
-        """Turn on with preset mode delegates to set_preset_mode."""
-        mock_fan_device.is_on = True
-        await fan_entity.async_turn_on(preset_mode=VS_MODE_AUTO)
-        mock_fan_device.set_auto_mode.assert_called_once()
-
-    async def test_turn_on_with_percentage(self, fan_entity, mock_fan_device):
-        """Turn on with specific percentage."""
-        mock_fan_device.is_on = True
-        await fan_entity.async_turn_on(percentage=75)
-        mock_fan_device.set_manual_mode.assert_called()
-
-    async def test_turn_on_default_percentage(self, fan_entity, mock_fan_device):
-        """Turn on with default 50% when no arguments given."""
+    @pytest.mark.parametrize(
+        ("kwargs", "device_method"),
+        [
+            ({"preset_mode": VS_MODE_AUTO}, "set_auto_mode"),
+            ({"percentage": 75}, "set_manual_mode"),
+            ({}, "set_manual_mode"),
+        ],
+        ids=["preset_mode", "percentage", "default"],
+    )
+    async def test_turn_on(self, fan_entity, mock_fan_device, kwargs, device_method):
+        """Turn on via preset mode, given percentage, or the default 50%."""
         mock_fan_device.is_on = True
-        await fan_entity.async_turn_on()
-        mock_fan_device.set_manual_mode.assert_called()
+        await fan_entity.async_turn_on(**kwargs)
+        getattr(mock_fan_device, device_method).assert_called()
 
     def test_extra_state_attributes(self, fan_entity, mock_fan_device):
         """Return extra state attributes from device details."""
-        mock_fan_device.state.to_dict = MagicMock(return_value={"humidity": 45, "some_other": "value"})
+        mock_fan_device.state.to_dict = lambda: {"humidity": 45, "some_other": "value"}
         attrs = fan_entity.extra_state_attributes
         # humidity gets remapped to current_humidity
         assert "current_humidity" in attrs
 
-    def test_lv_pur131s_speed_range(self, mock_coordinator):
+    def test_lv_pur131s_speed_range(self, lv_pur131s_fan_device, mock_coordinator):
         """Set speed range to (1, 3) for LV-PUR131S."""
-        device = MagicMock()
-        device.device_type = "LV-PUR131S"
-        device.fan_levels = []
-        device.modes = []
-        device.cid = "test"
-        device.sub_device_no = None
-        device.device_name = "Purifier"
-        device.connection_status = "online"
-        device.current_firm_version = "1.0"
-
-        fan = VeSyncFanHA(device, mock_coordinator)
+        fan = VeSyncFanHA(lv_pur131s_fan_device, mock_coordinator)
         assert fan._speed_range == (1, 3)
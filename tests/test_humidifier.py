@@ -1,7 +1,5 @@
 """Tests for VeSync humidifier platform."""
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from homeassistant.components.humidifier.const import (
@@ -28,42 +26,34 @@ from custom_components.vesync.humidifier import (
 class TestModeMapping:
     """Tests for mode mapping helpers."""
 
-    def test_get_ha_mode_auto(self):
-        """Map VeSync 'auto' to HA MODE_AUTO."""
-        assert _get_ha_mode("auto") == MODE_AUTO
-
-    def test_get_ha_mode_humidity(self):
-        """Map VeSync 'humidity' to HA MODE_AUTO."""
-        assert _get_ha_mode("humidity") == MODE_AUTO
-
-    def test_get_ha_mode_manual(self):
-        """Map VeSync 'manual' to HA MODE_NORMAL."""
-        assert _get_ha_mode("manual") == MODE_NORMAL
-
-    def test_get_ha_mode_sleep(self):
-        """Map VeSync 'sleep' to HA MODE_SLEEP."""
-        assert _get_ha_mode("sleep") == MODE_SLEEP
-
-    def test_get_ha_mode_unknown_returns_none(self):
-        """Return None for unknown VeSync mode."""
-        assert _get_ha_mode("turbo") is None
+    @pytest.mark.parametrize(
+        ("vs_mode", "ha_mode"),
+        [
+            ("auto", MODE_AUTO),
+            ("humidity", MODE_AUTO),
+            ("manual", MODE_NORMAL),
+            ("sleep", MODE_SLEEP),
+            ("turbo", None),
+        ],
+        ids=["auto", "humidity", "manual", "sleep", "unknown"],
+    )
+    def test_get_ha_mode(self, vs_mode, ha_mode):
+        """Map VeSync modes to HA modes, and unknown modes to None."""
+        assert _get_ha_mode(vs_mode) == ha_mode
 
     def test_get_vs_mode_auto(self):
         """Map HA MODE_AUTO to VeSync mode."""
-        result = _get_vs_mode(MODE_AUTO)
-        assert result is not None
-
-    def test_get_vs_mode_normal(self):
-        """Map HA MODE_NORMAL to VeSync 'manual'."""
-        assert _get_vs_mode(MODE_NORMAL) == "manual"
-
-    def test_get_vs_mode_sleep(self):
-        """Map HA MODE_SLEEP to VeSync 'sleep'."""
-        assert _get_vs_mode(MODE_SLEEP) == "sleep"
+        # Both 'auto' and 'humidity' map to MODE_AUTO, so either may come back.
+        assert _get_vs_mode(MODE_AUTO) is not None
 
-    def test_get_vs_mode_unknown_returns_none(self):
-        """Return None for unknown HA mode."""
-        assert _get_vs_mode("invalid") is None
+    @pytest.mark.parametrize(
+        ("ha_mode", "vs_mode"),
+        [(MODE_NORMAL, "manual"), (MODE_SLEEP, "sleep"), ("invalid", None)],
+        ids=["normal", "sleep", "unknown"],
+    )
+    def test_get_vs_mode(self, ha_mode, vs_mode):
+        """Map HA modes to VeSync modes, and unknown modes to None."""
+        assert _get_vs_mode(ha_mode) == vs_mode
 
 
 # ---------------------------------------------------------------------------
@@ -127,12 +117,6 @@ class TestVeSyncHumidifierHA:
         with pytest.raises(ValueError):
             await humidifier_entity.async_set_humidity(10)
 
-    async def test_set_humidity_device_failure(self, humidifier_entity, mock_humidifier_device):
-        """Raise ValueError when device returns failure."""
-        mock_humidifier_device.set_humidity.return_value = False
-        with pytest.raises(ValueError, match="error occurred"):
-            await humidifier_entity.async_set_humidity(50)
-
     async def test_set_mode_auto(self, humidifier_entity, mock_humidifier_device):
         """Set mode to auto."""
         await humidifier_entity.async_set_mode(MODE_AUTO)
@@ -143,43 +127,43 @@ class TestVeSyncHumidifierHA:
         with pytest.raises(ValueError):
             await humidifier_entity.async_set_mode("turbo")
 
-    async def test_set_mode_device_failure(self, humidifier_entity, mock_humidifier_device):
-        """Raise ValueError when set_mode returns failure."""
-        mock_humidifier_device.set_mode.return_value = False
-        with pytest.raises(ValueError, match="error occurred"):
-            await humidifier_entity.async_set_mode(MODE_AUTO)
-
     async def test_turn_on(self, humidifier_entity, mock_humidifier_device):
         """Turn on the humidifier."""
         mock_humidifier_device.turn_on.return_value = True
         await humidifier_entity.async_turn_on()
         mock_humidifier_device.turn_on.assert_called_once()
 
-    async def test_turn_on_failure(self, humidifier_entity, mock_humidifier_device):
-        """Raise ValueError when turn_on fails."""
-        mock_humidifier_device.turn_on.return_value = False
-        with pytest.raises(ValueError, match="error occurred"):
-            await humidifier_entity.async_turn_on()
-
     async def test_turn_off(self, humidifier_entity, mock_humidifier_device):
         """Turn off the humidifier."""
         mock_humidifier_device.turn_off.return_value = True
         await humidifier_entity.async_turn_off()
         mock_humidifier_device.turn_off.assert_called_once()
 
-    async def test_turn_off_failure(self, humidifier_entity, mock_humidifier_device):
-        """Raise ValueError when turn_off fails."""
-        mock_humidifier_device.turn_off.return_value = False
+    @pytest.mark.parametrize(
+        ("method", "args", "device_method"),
+        [
+            ("async_set_humidity", (50,), "set_humidity"),
+            ("async_set_mode", (MODE_AUTO,), "set_mode"),
+            ("async_turn_on", (), "turn_on"),
+            ("async_turn_off", (), "turn_off"),
+        ],
+        ids=["set_humidity", "set_mode", "turn_on", "turn_off"],
+    )
+    async def test_device_failure_raises(
+        self, humidifier_entity, mock_humidifier_device, method, args, device_method
+    ):
+        """Raise ValueError when the device reports a failed command."""
+        getattr(mock_humidifier_device, device_method).return_value = False
         with pytest.raises(ValueError, match="error occurred"):
-            await humidifier_entity.async_turn_off()
+            await getattr(humidifier_entity, method)(*args)
 
     def test_extra_state_attributes(self, humidifier_entity, mock_humidifier_device):
         """Return mapped extra state attributes."""
-        mock_humidifier_device.state.to_dict = MagicMock(return_value={
+        mock_humidifier_device.state.to_dict = lambda: {
             "humidity": 55,
             "mode": "auto",
             "mist_level": 3,
-        })
+        }
         attrs = humidifier_entity.extra_state_attributes
         # humidity gets remapped to current_humidity
         assert "current_humidity" in attrs
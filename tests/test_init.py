@@ -1,6 +1,7 @@
 """Tests for VeSync integration setup and teardown."""
 
 from datetime import timedelta
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,12 +10,19 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.vesync import async_setup_entry, async_unload_entry
+import custom_components.vesync as vesync_integration
+from custom_components.vesync import (
+    PLATFORMS,
+    async_setup_entry,
+    async_unload_entry,
+)
 from custom_components.vesync.const import (
     DOMAIN,
+    ENERGY_UPDATE_INTERVAL,
     SERVICE_UPDATE_DEVS,
     VS_BINARY_SENSORS,
     VS_BUTTON,
+    VS_DISCOVERY,
     VS_FANS,
     VS_HUMIDIFIERS,
     VS_LIGHTS,
@@ -29,6 +37,21 @@ from custom_components.vesync.const import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+# async_setup_entry only reads the per-platform device sequences, so one
+# immutable "no devices" result is shared by every test.
+_EMPTY_PLATFORMS = MappingProxyType(
+    {
+        VS_SWITCHES: (),
+        VS_FANS: (),
+        VS_LIGHTS: (),
+        VS_SENSORS: (),
+        VS_HUMIDIFIERS: (),
+        VS_NUMBERS: (),
+        VS_BINARY_SENSORS: (),
+        VS_BUTTON: (),
+    }
+)
+
 
 def _make_config_entry(hass):
     """Create a real-ish MockConfigEntry."""
@@ -50,259 +73,231 @@ def _make_config_entry(hass):
 # ---------------------------------------------------------------------------
 
 
+# Patchers bound to the integration module object, so starting them does not
+# re-import the dotted target path for every test.
+_VESYNC_PATCHER = patch.object(vesync_integration, "VeSync")
+_PROCESS_PATCHER = patch.object(vesync_integration, "async_process_devices")
+
+
+@pytest.fixture
+def vesync_patches():
+    """Patch the VeSync manager and device processing for async_setup_entry.
+
+    The manager logs in successfully and finds no devices; tests tweak only
+    what they need.
+    """
+    mock_vesync_class = _VESYNC_PATCHER.start()
+    mock_process = _PROCESS_PATCHER.start()
+    try:
+        manager = mock_vesync_class.return_value
+        manager.__aenter__ = AsyncMock(return_value=manager)
+        manager.__aexit__ = AsyncMock(return_value=False)
+        manager.login = AsyncMock(return_value=True)
+        manager.update = AsyncMock()
+        mock_process.return_value = _EMPTY_PLATFORMS
+        yield SimpleNamespace(
+            vesync=mock_vesync_class, process=mock_process, manager=manager
+        )
+    finally:
+        _PROCESS_PATCHER.stop()
+        _VESYNC_PATCHER.stop()
+
+
 class TestAsyncSetupEntry:
     """Tests for async_setup_entry."""
 
-    async def test_successful_setup(self, hass: HomeAssistant):
+    async def test_successful_setup(self, hass: HomeAssistant, vesync_patches):
         """Set up integration successfully with a valid login."""
         entry = _make_config_entry(hass)
 
-        with (
-            patch("custom_components.vesync.VeSync") as mock_vesync_class,
-            patch(
-                "custom_components.vesync.async_process_devices"
-            ) as mock_process,
-        ):
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=True)
-            manager.update = AsyncMock()
-
-            mock_process.return_value = {
-                VS_SWITCHES: [],
-                VS_FANS: [],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
-            }
-
-            result = await async_setup_entry(hass, entry)
+        result = await async_setup_entry(hass, entry)
 
         assert result is True
         assert DOMAIN in hass.data
         assert entry.entry_id in hass.data[DOMAIN]
         assert VS_MANAGER in hass.data[DOMAIN][entry.entry_id]
 
-    async def test_failed_login_returns_false(self, hass: HomeAssistant):
+    async def test_failed_login_returns_false(
+        self, hass: HomeAssistant, vesync_patches
+    ):
         """Return False when VeSync login fails."""
         entry = _make_config_entry(hass)
+        vesync_patches.manager.login.return_value = False
 
-        with patch("custom_components.vesync.VeSync") as mock_vesync_class:
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=False)
-
-            result = await async_setup_entry(hass, entry)
+        result = await async_setup_entry(hass, entry)
 
         assert result is False
 
-    async def test_coordinator_is_created(self, hass: HomeAssistant):
+    async def test_coordinator_is_created(self, hass: HomeAssistant, vesync_patches):
         """Create a DataUpdateCoordinator on setup."""
         entry = _make_config_entry(hass)
 
-        with (
-            patch("custom_components.vesync.VeSync") as mock_vesync_class,
-            patch(
-                "custom_components.vesync.async_process_devices"
-            ) as mock_process,
-        ):
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=True)
-            manager.update = AsyncMock()
-
-            mock_process.return_value = {
-                VS_SWITCHES: [],
-                VS_FANS: [],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
-            }
-
-            await async_setup_entry(hass, entry)
+        await async_setup_entry(hass, entry)
 
         assert "coordinator" in hass.data[DOMAIN][entry.entry_id]
 
-    async def test_coordinator_update_failure_raises(self, hass: HomeAssistant):
+    async def test_coordinator_update_failure_raises(
+        self, hass: HomeAssistant, vesync_patches
+    ):
         """Raise UpdateFailed when manager.update raises an exception."""
         entry = _make_config_entry(hass)
+        vesync_patches.manager.update.side_effect = RuntimeError("Connection error")
 
-        with (
-            patch("custom_components.vesync.VeSync") as mock_vesync_class,
-            patch(
-                "custom_components.vesync.async_process_devices"
-            ) as mock_process,
-        ):
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=True)
-            manager.update = AsyncMock(side_effect=RuntimeError("Connection error"))
-
-            mock_process.return_value = {
-                VS_SWITCHES: [],
-                VS_FANS: [],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
-            }
-
-            # The setup should still succeed (coordinator catches the error)
-            result = await async_setup_entry(hass, entry)
+        # The setup should still succeed (coordinator catches the error)
+        result = await async_setup_entry(hass, entry)
 
         assert result is True
         coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
         # The coordinator should have recorded the update failure
         assert coordinator.last_update_success is False
 
-    async def test_service_registered(self, hass: HomeAssistant):
-        """Register the update_devices service on setup."""
+    async def test_coordinator_throttles_outlet_energy(
+        self, hass: HomeAssistant, vesync_patches, freezer
+    ):
+        """Fetch outlet energy at setup, then at most once per interval."""
         entry = _make_config_entry(hass)
+        outlets = [
+            SimpleNamespace(
+                cid=f"outlet-{i}", device_name=f"Outlet {i}", update_energy=AsyncMock()
+            )
+            for i in range(2)
+        ]
+        vesync_patches.manager.devices.outlets = outlets
 
-        with (
-            patch("custom_components.vesync.VeSync") as mock_vesync_class,
-            patch(
-                "custom_components.vesync.async_process_devices"
-            ) as mock_process,
-        ):
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=True)
-            manager.update = AsyncMock()
-
-            mock_process.return_value = {
-                VS_SWITCHES: [],
-                VS_FANS: [],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
-            }
+        await async_setup_entry(hass, entry)
 
-            await async_setup_entry(hass, entry)
+        for outlet in outlets:
+            outlet.update_energy.assert_awaited_once()
+
+        # A regular poll inside the interval does not refetch energy history
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        await coordinator.async_refresh()
+
+        for outlet in outlets:
+            assert outlet.update_energy.await_count == 1
+
+        # Once the interval has passed, the next poll refreshes it
+        freezer.tick(ENERGY_UPDATE_INTERVAL)
+        await coordinator.async_refresh()
+
+        for outlet in outlets:
+            assert outlet.update_energy.await_count == 2
+
+    async def test_new_outlet_energy_fetched_on_next_poll(
+        self, hass: HomeAssistant, vesync_patches
+    ):
+        """Fetch energy for an outlet added after setup on the next poll."""
+        entry = _make_config_entry(hass)
+        first = SimpleNamespace(
+            cid="outlet-0", device_name="Outlet 0", update_energy=AsyncMock()
+        )
+        vesync_patches.manager.devices.outlets = [first]
+
+        await async_setup_entry(hass, entry)
+
+        added = SimpleNamespace(
+            cid="outlet-1", device_name="Outlet 1", update_energy=AsyncMock()
+        )
+        vesync_patches.manager.devices.outlets = [first, added]
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        await coordinator.async_refresh()
+
+        first.update_energy.assert_awaited_once()
+        added.update_energy.assert_awaited_once()
+
+    async def test_outlet_energy_failure_is_logged(
+        self, hass: HomeAssistant, vesync_patches, caplog
+    ):
+        """Log a failed energy update without failing the refresh."""
+        entry = _make_config_entry(hass)
+        broken = SimpleNamespace(
+            cid="broken-cid",
+            device_name="Broken outlet",
+            update_energy=AsyncMock(side_effect=RuntimeError("timeout")),
+        )
+        working = SimpleNamespace(
+            cid="outlet-cid", device_name="Outlet", update_energy=AsyncMock()
+        )
+        vesync_patches.manager.devices.outlets = [broken, working]
+
+        await async_setup_entry(hass, entry)
+
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        assert coordinator.last_update_success is True
+        working.update_energy.assert_awaited_once()
+        assert "Unable to update energy for Broken outlet" in caplog.text
+
+    async def test_service_registered(self, hass: HomeAssistant, vesync_patches):
+        """Register the update_devices service on setup."""
+        entry = _make_config_entry(hass)
+
+        await async_setup_entry(hass, entry)
 
         assert hass.services.has_service(DOMAIN, SERVICE_UPDATE_DEVS)
 
-    async def test_platforms_forwarded_when_devices_exist(self, hass: HomeAssistant):
+    @pytest.mark.parametrize(
+        ("platform", "platform_key"),
+        [pytest.param(p, key, id=str(p)) for p, key in PLATFORMS.items()],
+    )
+    async def test_platforms_forwarded_when_devices_exist(
+        self, hass: HomeAssistant, vesync_patches, platform, platform_key
+    ):
         """Forward platform setup when devices are present."""
         entry = _make_config_entry(hass)
 
         mock_device = MagicMock()
+        vesync_patches.process.return_value = {
+            **_EMPTY_PLATFORMS,
+            platform_key: [mock_device],
+        }
 
-        with (
-            patch("custom_components.vesync.VeSync") as mock_vesync_class,
-            patch(
-                "custom_components.vesync.async_process_devices"
-            ) as mock_process,
-            patch.object(
-                hass.config_entries,
-                "async_forward_entry_setups",
-                new=AsyncMock(),
-            ) as mock_forward,
-        ):
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=True)
-            manager.update = AsyncMock()
-
-            mock_process.return_value = {
-                VS_SWITCHES: [mock_device],
-                VS_FANS: [],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
-            }
-
+        with patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            new=AsyncMock(),
+        ) as mock_forward:
             await async_setup_entry(hass, entry)
 
         # Verify devices stored in hass.data
-        assert mock_device in hass.data[DOMAIN][entry.entry_id][VS_SWITCHES]
-        # Verify platform setup was forwarded for switch platform
-        mock_forward.assert_called_once()
-        forwarded_platforms = mock_forward.call_args[0][1]
-        assert "switch" in [str(p) for p in forwarded_platforms]
+        assert mock_device in hass.data[DOMAIN][entry.entry_id][platform_key]
+        # Verify setup was forwarded for that platform only
+        mock_forward.assert_called_once_with(entry, [platform])
+
+    async def test_no_platforms_forwarded_without_devices(
+        self, hass: HomeAssistant, vesync_patches
+    ):
+        """Skip platform forwarding when no devices are found."""
+        entry = _make_config_entry(hass)
+
+        with patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            new=AsyncMock(),
+        ) as mock_forward:
+            await async_setup_entry(hass, entry)
 
-    async def test_manager_stored_in_hass_data(self, hass: HomeAssistant):
+        mock_forward.assert_not_called()
+
+    async def test_manager_stored_in_hass_data(
+        self, hass: HomeAssistant, vesync_patches
+    ):
         """Store the VeSync manager in hass.data."""
         entry = _make_config_entry(hass)
 
-        with (
-            patch("custom_components.vesync.VeSync") as mock_vesync_class,
-            patch(
-                "custom_components.vesync.async_process_devices"
-            ) as mock_process,
-        ):
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=True)
-            manager.update = AsyncMock()
-
-            mock_process.return_value = {
-                VS_SWITCHES: [],
-                VS_FANS: [],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
-            }
-
-            await async_setup_entry(hass, entry)
+        await async_setup_entry(hass, entry)
 
-        assert hass.data[DOMAIN][entry.entry_id][VS_MANAGER] is manager
+        assert hass.data[DOMAIN][entry.entry_id][VS_MANAGER] is vesync_patches.manager
 
-    async def test_timezone_passed_to_manager(self, hass: HomeAssistant):
+    async def test_timezone_passed_to_manager(
+        self, hass: HomeAssistant, vesync_patches
+    ):
         """Pass the HA timezone to VeSync manager."""
         entry = _make_config_entry(hass)
 
-        with (
-            patch("custom_components.vesync.VeSync") as mock_vesync_class,
-            patch(
-                "custom_components.vesync.async_process_devices"
-            ) as mock_process,
-        ):
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=True)
-            manager.update = AsyncMock()
-
-            mock_process.return_value = {
-                VS_SWITCHES: [],
-                VS_FANS: [],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
-            }
-
-            await async_setup_entry(hass, entry)
+        await async_setup_entry(hass, entry)
 
         # VeSync constructor called with username, password, timezone
-        mock_vesync_class.assert_called_once_with(
+        vesync_patches.vesync.assert_called_once_with(
             "test@example.com",
             "test_password",
             time_zone=str(hass.config.time_zone),
@@ -368,61 +363,33 @@ class TestAddNewDevicesBugFix:
     each platform.
     """
 
-    async def test_new_fan_detected_correctly(self, hass: HomeAssistant):
+    async def test_new_fan_detected_correctly(
+        self, hass: HomeAssistant, vesync_patches
+    ):
         """Detect a new fan device when processing the fan platform."""
         entry = _make_config_entry(hass)
         new_fan = MagicMock()
 
-        with (
-            patch("custom_components.vesync.VeSync") as mock_vesync_class,
-            patch(
-                "custom_components.vesync.async_process_devices"
-            ) as mock_process,
-            patch("custom_components.vesync.async_dispatcher_send") as mock_dispatch,
-        ):
-            manager = mock_vesync_class.return_value
-            manager.__aenter__ = AsyncMock(return_value=manager)
-            manager.__aexit__ = AsyncMock(return_value=False)
-            manager.login = AsyncMock(return_value=True)
-            manager.update = AsyncMock()
-
+        with patch("custom_components.vesync.async_dispatcher_send") as mock_dispatch:
             # Initial setup with no devices
-            mock_process.return_value = {
-                VS_SWITCHES: [],
-                VS_FANS: [],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
-            }
-
             await async_setup_entry(hass, entry)
 
             # Now simulate discovering a new fan (but no new switches)
-            mock_process.return_value = {
-                VS_SWITCHES: [],
+            vesync_patches.process.return_value = {
+                **_EMPTY_PLATFORMS,
                 VS_FANS: [new_fan],
-                VS_LIGHTS: [],
-                VS_SENSORS: [],
-                VS_HUMIDIFIERS: [],
-                VS_NUMBERS: [],
-                VS_BINARY_SENSORS: [],
-                VS_BUTTON: [],
             }
 
             # Call the update_devices service
-            await hass.services.async_call(
-                DOMAIN, SERVICE_UPDATE_DEVS, blocking=True
-            )
+            await hass.services.async_call(DOMAIN, SERVICE_UPDATE_DEVS, blocking=True)
 
         # The new fan should have been detected and dispatched.
         # Before the bug fix, this would fail because the code
         # always compared against VS_SWITCHES (which was empty),
         # rather than VS_FANS.
+        fan_signal = VS_DISCOVERY.format(VS_FANS)
         fan_dispatched = any(
-            VS_FANS in str(call) for call in mock_dispatch.call_args_list
+            call.args[1] == fan_signal for call in mock_dispatch.call_args_list
         )
         assert fan_dispatched, (
             "New fan device should be detected and dispatched "
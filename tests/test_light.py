@@ -1,6 +1,6 @@
 """Tests for VeSync light platform."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -24,56 +24,46 @@ from custom_components.vesync.light import (
 # Brightness conversion tests
 # ---------------------------------------------------------------------------
 
+# Every VeSync brightness paired with its value after a trip through HA.
+_ROUNDTRIP = [
+    (vesync_val, _ha_brightness_to_vesync(_vesync_brightness_to_ha(vesync_val)))
+    for vesync_val in range(1, 101)
+]
+
 
 class TestBrightnessConversion:
     """Tests for brightness conversion helpers."""
 
-    def test_vesync_to_ha_mid_range(self):
-        """Convert 50% VeSync brightness to HA range."""
-        result = _vesync_brightness_to_ha(50)
-        assert result == round((50 / 100) * 255)
-
-    def test_vesync_to_ha_full(self):
-        """Convert 100% VeSync brightness to 255."""
+    def test_vesync_to_ha_matches_formula(self):
+        """Scale every VeSync percentage to 0-255, clamping zero to one."""
+        percents = range(0, 101)
+        expected = [round((max(1, p) / 100) * 255) for p in percents]
+        assert [_vesync_brightness_to_ha(p) for p in percents] == expected
         assert _vesync_brightness_to_ha(100) == 255
 
-    def test_vesync_to_ha_minimum(self):
-        """Convert 1% VeSync brightness to minimum HA value."""
-        result = _vesync_brightness_to_ha(1)
-        assert result == round((1 / 100) * 255)
-
-    def test_vesync_to_ha_zero_clamps_to_one(self):
-        """Clamp zero brightness to at least 1 before converting."""
-        result = _vesync_brightness_to_ha(0)
-        assert result == round((1 / 100) * 255)
-
     def test_vesync_to_ha_invalid_returns_none(self):
         """Return None for non-numeric brightness values."""
         assert _vesync_brightness_to_ha("invalid") is None
 
-    def test_ha_to_vesync_full(self):
-        """Convert 255 HA brightness to 100%."""
+    def test_ha_to_vesync_stays_in_percent_range(self):
+        """Map every HA brightness into 1-100, with 255 as 100%."""
+        percents = [_ha_brightness_to_vesync(b) for b in range(0, 256)]
+        assert min(percents) == 1
+        assert max(percents) == 100
         assert _ha_brightness_to_vesync(255) == 100
 
-    def test_ha_to_vesync_minimum(self):
-        """Convert 1 HA brightness to at least 1%."""
-        assert _ha_brightness_to_vesync(1) >= 1
-
-    def test_ha_to_vesync_mid_range(self):
-        """Convert mid-range HA brightness to percent."""
-        result = _ha_brightness_to_vesync(128)
-        assert 1 <= result <= 100
-
     def test_ha_to_vesync_clamps_max(self):
         """Clamp values above 255 to 100%."""
         assert _ha_brightness_to_vesync(300) == 100
 
     def test_roundtrip_conversion(self):
         """Round-trip conversion preserves approximate value."""
-        for vesync_val in [10, 25, 50, 75, 100]:
-            ha_val = _vesync_brightness_to_ha(vesync_val)
-            back = _ha_brightness_to_vesync(ha_val)
-            assert abs(back - vesync_val) <= 1
+        drifted = [
+            (vesync_val, back)
+            for vesync_val, back in _ROUNDTRIP
+            if abs(back - vesync_val) > 1
+        ]
+        assert drifted == []
 
 
 # ---------------------------------------------------------------------------
@@ -204,20 +194,14 @@ class TestVeSyncNightLightHA:
         """Append 'night light' to entity name."""
         assert night_light_entity.name.endswith("night light")
 
-    def test_is_on_with_night_light_on(self, night_light_entity, night_light_device):
-        """Return True when night_light is 'on'."""
-        night_light_device.state.nightlight_status = "on"
-        assert night_light_entity.is_on is True
-
-    def test_is_on_with_night_light_dim(self, night_light_entity, night_light_device):
-        """Return True when night_light is 'dim'."""
-        night_light_device.state.nightlight_status = "dim"
-        assert night_light_entity.is_on is True
-
-    def test_is_on_with_night_light_off(self, night_light_entity, night_light_device):
-        """Return False when night_light is 'off'."""
-        night_light_device.state.nightlight_status = "off"
-        assert night_light_entity.is_on is False
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [("on", True), ("dim", True), ("off", False), ("", False), (None, False)],
+    )
+    def test_is_on(self, night_light_entity, night_light_device, status, expected):
+        """Return True only when the night light is 'on' or 'dim'."""
+        night_light_device.state.nightlight_status = status
+        assert night_light_entity.is_on is expected
 
     def test_brightness_with_numeric(self, night_light_entity, night_light_device):
         """Return converted brightness for numeric night_light_brightness."""
@@ -227,17 +211,16 @@ class TestVeSyncNightLightHA:
         expected = _vesync_brightness_to_ha(50)
         assert night_light_entity.brightness == expected
 
-    async def test_turn_on_fan_type_full(self, night_light_entity, night_light_device):
-        """Call set_nightlight_mode('on') for fan types at full brightness."""
-        night_light_device.product_type = "fan"
-        await night_light_entity.async_turn_on(**{ATTR_BRIGHTNESS: 255})
-        night_light_device.set_nightlight_mode.assert_called_with("on")
-
-    async def test_turn_on_fan_type_dim(self, night_light_entity, night_light_device):
-        """Call set_nightlight_mode('dim') for fan types at lower brightness."""
+    @pytest.mark.parametrize(
+        ("brightness", "mode"), [(255, "on"), (100, "dim")], ids=["full", "dim"]
+    )
+    async def test_turn_on_fan_type(
+        self, night_light_entity, night_light_device, brightness, mode
+    ):
+        """Call set_nightlight_mode('on'/'dim') for fan types by brightness."""
         night_light_device.product_type = "fan"
-        await night_light_entity.async_turn_on(**{ATTR_BRIGHTNESS: 100})
-        night_light_device.set_nightlight_mode.assert_called_with("dim")
+        await night_light_entity.async_turn_on(**{ATTR_BRIGHTNESS: brightness})
+        night_light_device.set_nightlight_mode.assert_called_with(mode)
 
     async def test_turn_off_fan_type(self, night_light_entity, night_light_device):
         """Call set_nightlight_mode('off') for fan types."""
@@ -245,50 +228,20 @@ class TestVeSyncNightLightHA:
         await night_light_entity.async_turn_off()
         night_light_device.set_nightlight_mode.assert_called_with("off")
 
-    async def test_turn_on_non_fan_with_brightness(self, mock_coordinator):
+    async def test_turn_on_non_fan_with_brightness(
+        self, mock_humidifier_nightlight_device, mock_coordinator
+    ):
         """Call set_nightlight_brightness for non-fan types."""
-        device = MagicMock()
-        device.device_type = "LUH-D301S-WEU"
-        device.cid = "test"
-        device.sub_device_no = None
-        device.device_name = "Humidifier"
-        device.connection_status = "online"
-        device.current_firm_version = "1.0"
-        device.supports_nightlight = True
-        device.supports_nightlight_brightness = True
-        device.product_type = "humidifier"
-        state = MagicMock()
-        state.nightlight_brightness = 50
-        state.nightlight_status = "on"
-        state.brightness = 50
-        device.state = state
-        device.set_nightlight_brightness = AsyncMock()
-        device.set_nightlight_mode = AsyncMock()
-
+        device = mock_humidifier_nightlight_device
         entity = VeSyncNightLightHA(device, mock_coordinator)
         await entity.async_turn_on(**{ATTR_BRIGHTNESS: 200})
         device.set_nightlight_brightness.assert_called_once()
 
-    async def test_turn_off_non_fan(self, mock_coordinator):
+    async def test_turn_off_non_fan(
+        self, mock_humidifier_nightlight_device, mock_coordinator
+    ):
         """Call set_nightlight_brightness(0) for non-fan types."""
-        device = MagicMock()
-        device.device_type = "LUH-D301S-WEU"
-        device.cid = "test"
-        device.sub_device_no = None
-        device.device_name = "Humidifier"
-        device.connection_status = "online"
-        device.current_firm_version = "1.0"
-        device.supports_nightlight = True
-        device.supports_nightlight_brightness = True
-        device.product_type = "humidifier"
-        state = MagicMock()
-        state.nightlight_brightness = 50
-        state.nightlight_status = "on"
-        state.brightness = 50
-        device.state = state
-        device.set_nightlight_brightness = AsyncMock()
-        device.set_nightlight_mode = AsyncMock()
-
+        device = mock_humidifier_nightlight_device
         entity = VeSyncNightLightHA(device, mock_coordinator)
         await entity.async_turn_off()
         device.set_nightlight_brightness.assert_called_with(0)
@@ -1,9 +1,11 @@
 """Tests for VeSync number platform."""
 
+from typing import NamedTuple
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from homeassistant.const import PERCENTAGE
 from homeassistant.helpers.entity import EntityCategory
 
 from custom_components.vesync.number import (
@@ -15,152 +17,138 @@ from custom_components.vesync.number import (
 
 
 # ---------------------------------------------------------------------------
-# VeSyncFanSpeedLevelHA tests
+# Behaviour shared by every level entity
 # ---------------------------------------------------------------------------
 
 
-class TestVeSyncFanSpeedLevelHA:
-    """Tests for VeSyncFanSpeedLevelHA entity."""
-
-    @pytest.fixture
-    def speed_entity(self, mock_fan_device, mock_coordinator):
-        """Return a fan speed level entity."""
-        return VeSyncFanSpeedLevelHA(mock_fan_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, speed_entity):
-        """Append -fan-speed-level to unique_id."""
-        assert speed_entity.unique_id.endswith("-fan-speed-level")
-
-    def test_name_suffix(self, speed_entity):
-        """Append 'fan speed level' to name."""
-        assert "fan speed level" in speed_entity.name
-
-    def test_min_value(self, speed_entity):
-        """Return minimum value from config levels."""
-        assert speed_entity.native_min_value == 1
-
-    def test_max_value(self, speed_entity):
-        """Return maximum value from config levels."""
-        assert speed_entity.native_max_value == 3
-
-    def test_native_value(self, speed_entity, mock_fan_device):
-        """Return current speed from device."""
-        mock_fan_device.state.fan_level = 2
-        assert speed_entity.native_value == 2
-
-    async def test_set_native_value(self, speed_entity, mock_fan_device):
-        """Call set_fan_speed with integer value."""
-        await speed_entity.async_set_native_value(3)
-        mock_fan_device.set_fan_speed.assert_called_once_with(3)
-
-    def test_entity_category(self, speed_entity):
-        """Return CONFIG entity category."""
-        assert speed_entity.entity_category == EntityCategory.CONFIG
-
-    def test_extra_state_attributes(self, speed_entity, mock_fan_device):
-        """Return fan speed levels in attributes."""
-        attrs = speed_entity.extra_state_attributes
-        assert "fan speed levels" in attrs
-        assert attrs["fan speed levels"] == [1, 2, 3]
+class _LevelCase(NamedTuple):
+    """Expected behaviour of one level entity against its mock device."""
+
+    entity_cls: type
+    device_fixture: str
+    suffix: str
+    min_value: int
+    max_value: int
+    value: int
+    setter: str
+    new_value: int
+
+
+_LEVEL_CASES = (
+    _LevelCase(
+        VeSyncFanSpeedLevelHA,
+        "mock_fan_device",
+        "-fan-speed-level",
+        1,
+        3,
+        2,
+        "set_fan_speed",
+        3,
+    ),
+    _LevelCase(
+        VeSyncHumidifierMistLevelHA,
+        "mock_humidifier_device",
+        "-mist-level",
+        1,
+        9,
+        3,
+        "set_mist_level",
+        5,
+    ),
+    _LevelCase(
+        VeSyncHumidifierWarmthLevelHA,
+        "mock_humidifier_device",
+        "-warm-mist",
+        0,
+        3,
+        0,
+        "set_warm_level",
+        2,
+    ),
+    _LevelCase(
+        VeSyncHumidifierTargetLevelHA,
+        "mock_humidifier_device",
+        "-target-level",
+        30,
+        80,
+        55,
+        "set_humidity",
+        60,
+    ),
+)
 
 
-# ---------------------------------------------------------------------------
-# VeSyncHumidifierMistLevelHA tests
-# ---------------------------------------------------------------------------
+class TestVeSyncLevelEntities:
+    """Tests shared by the fan speed, mist, warmth and target level entities."""
 
+    @pytest.fixture(params=_LEVEL_CASES, ids=lambda case: case.entity_cls.__name__)
+    def case(self, request):
+        """Return the expectations for one level entity."""
+        return request.param
 
-class TestVeSyncHumidifierMistLevelHA:
-    """Tests for VeSyncHumidifierMistLevelHA entity."""
+    @pytest.fixture
+    def device(self, case, request):
+        """Return the mock device the entity is built from."""
+        return request.getfixturevalue(case.device_fixture)
 
     @pytest.fixture
-    def mist_entity(self, mock_humidifier_device, mock_coordinator):
-        """Return a mist level entity."""
-        return VeSyncHumidifierMistLevelHA(mock_humidifier_device, mock_coordinator)
+    def level_entity(self, case, device, mock_coordinator):
+        """Return the level entity under test."""
+        return case.entity_cls(device, mock_coordinator)
 
-    def test_unique_id_suffix(self, mist_entity):
-        """Append -mist-level to unique_id."""
-        assert mist_entity.unique_id.endswith("-mist-level")
+    def test_unique_id_suffix(self, case, level_entity):
+        """Append the entity's suffix to unique_id."""
+        assert level_entity.unique_id.endswith(case.suffix)
 
-    def test_min_max_values(self, mist_entity):
-        """Set min/max from device mist_levels config."""
-        assert mist_entity.native_min_value == 1
-        assert mist_entity.native_max_value == 9
+    def test_min_max_values(self, case, level_entity):
+        """Set min/max from the device's levels or the humidity limits."""
+        assert level_entity.native_min_value == case.min_value
+        assert level_entity.native_max_value == case.max_value
 
-    def test_native_value(self, mist_entity, mock_humidifier_device):
-        """Return mist_virtual_level from details."""
-        assert mist_entity.native_value == 3
+    def test_native_value(self, case, level_entity):
+        """Return the current level from the device state."""
+        assert level_entity.native_value == case.value
 
-    async def test_set_native_value(self, mist_entity, mock_humidifier_device):
-        """Call set_mist_level with integer value."""
-        await mist_entity.async_set_native_value(5)
-        mock_humidifier_device.set_mist_level.assert_called_once_with(5)
+    async def test_set_native_value(self, case, level_entity, device):
+        """Call the device setter with the integer value."""
+        await level_entity.async_set_native_value(case.new_value)
+        getattr(device, case.setter).assert_called_once_with(case.new_value)
 
 
 # ---------------------------------------------------------------------------
-# VeSyncHumidifierWarmthLevelHA tests
+# Entity-specific tests
 # ---------------------------------------------------------------------------
 
 
-class TestVeSyncHumidifierWarmthLevelHA:
-    """Tests for VeSyncHumidifierWarmthLevelHA entity."""
+class TestVeSyncFanSpeedLevelHA:
+    """Tests for VeSyncFanSpeedLevelHA entity."""
 
     @pytest.fixture
-    def warmth_entity(self, mock_humidifier_device, mock_coordinator):
-        """Return a warm mist level entity."""
-        return VeSyncHumidifierWarmthLevelHA(mock_humidifier_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, warmth_entity):
-        """Append -warm-mist to unique_id."""
-        assert warmth_entity.unique_id.endswith("-warm-mist")
-
-    def test_min_max_values(self, warmth_entity):
-        """Set min/max from device warm_mist_levels config."""
-        assert warmth_entity.native_min_value == 0
-        assert warmth_entity.native_max_value == 3
-
-    def test_native_value(self, warmth_entity, mock_humidifier_device):
-        """Return warm_mist_level from state."""
-        assert warmth_entity.native_value == 0
+    def speed_entity(self, mock_fan_device, mock_coordinator):
+        """Return a fan speed level entity."""
+        return VeSyncFanSpeedLevelHA(mock_fan_device, mock_coordinator)
 
-    async def test_set_native_value(self, warmth_entity, mock_humidifier_device):
-        """Call set_warm_level with integer value."""
-        await warmth_entity.async_set_native_value(2)
-        mock_humidifier_device.set_warm_level.assert_called_once_with(2)
+    def test_name_suffix(self, speed_entity):
+        """Append 'fan speed level' to name."""
+        assert "fan speed level" in speed_entity.name
 
+    def test_entity_category(self, speed_entity):
+        """Return CONFIG entity category."""
+        assert speed_entity.entity_category == EntityCategory.CONFIG
 
-# ---------------------------------------------------------------------------
-# VeSyncHumidifierTargetLevelHA tests
-# ---------------------------------------------------------------------------
+    def test_extra_state_attributes(self, speed_entity, mock_fan_device):
+        """Return fan speed levels in attributes."""
+        attrs = speed_entity.extra_state_attributes
+        assert "fan speed levels" in attrs
+        assert attrs["fan speed levels"] == [1, 2, 3]
 
 
 class TestVeSyncHumidifierTargetLevelHA:
     """Tests for VeSyncHumidifierTargetLevelHA entity."""
 
-    @pytest.fixture
-    def target_entity(self, mock_humidifier_device, mock_coordinator):
-        """Return a target humidity level entity."""
-        return VeSyncHumidifierTargetLevelHA(mock_humidifier_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, target_entity):
-        """Append -target-level to unique_id."""
-        assert target_entity.unique_id.endswith("-target-level")
-
-    def test_min_max_values(self, target_entity):
-        """Set min/max from constants."""
-        assert target_entity.native_min_value == 30
-        assert target_entity.native_max_value == 80
-
-    def test_native_value(self, target_entity, mock_humidifier_device):
-        """Return auto_target_humidity from state."""
-        assert target_entity.native_value == 55
-
-    async def test_set_native_value(self, target_entity, mock_humidifier_device):
-        """Call set_humidity with integer value."""
-        await target_entity.async_set_native_value(60)
-        mock_humidifier_device.set_humidity.assert_called_once_with(60)
-
-    def test_unit(self, target_entity):
+    def test_unit(self, mock_humidifier_device, mock_coordinator):
         """Return percentage unit."""
-        from homeassistant.const import PERCENTAGE
-
+        target_entity = VeSyncHumidifierTargetLevelHA(
+            mock_humidifier_device, mock_coordinator
+        )
         assert target_entity.native_unit_of_measurement == PERCENTAGE
@@ -0,0 +1,42 @@
+"""Benchmarks for the shared mock setup and device routing.
+
+Deselected on a normal run; run them on their own with
+``pytest tests/test_perf_fixtures.py --benchmark-only``.
+"""
+
+import pytest
+
+from custom_components.vesync.common import async_process_devices
+
+from .conftest import _OUTLET_ATTRS, _make_mock, _make_state
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+
+def _process_devices(manager):
+    """Run async_process_devices to completion without an event loop.
+
+    The routing never awaits and never touches hass, so the coroutine finishes
+    on its first step.
+    """
+    coro = async_process_devices(None, manager)
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError("async_process_devices suspended unexpectedly")
+
+
+def test_bench_make_mock(benchmark):
+    """Benchmark building a mock outlet device."""
+    state = _make_state(power=15.5, voltage=120.0)
+    benchmark(_make_mock, _OUTLET_ATTRS, {"product_type": "outlet"}, state)
+
+
+def test_bench_process_devices(benchmark, mock_vesync_manager):
+    """Benchmark routing a populated manager's devices to platforms."""
+    result = benchmark(_process_devices, mock_vesync_manager)
+    assert result
@@ -1,6 +1,8 @@
 """Tests for VeSync sensor platform."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import MappingProxyType, SimpleNamespace
+from typing import NamedTuple
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -12,6 +14,7 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
 )
+from homeassistant.helpers.entity import EntityCategory
 
 from custom_components.vesync.const import SENSOR_TYPES_AIRFRYER
 from custom_components.vesync.sensor import (
@@ -28,27 +31,31 @@ from custom_components.vesync.sensor import (
     VeSyncairfryerSensor,
 )
 
+from .conftest import _make_mock
+
 
 # ---------------------------------------------------------------------------
 # Helper to create a purifier/humidifier mock device with specific details
 # ---------------------------------------------------------------------------
 
 
+# Fixed purifier attributes, built once and shared by every helper call.
+_PURIFIER_ATTRS = MappingProxyType(
+    {
+        "cid": "purifier-cid",
+        "sub_device_no": None,
+        "device_name": "Purifier",
+        "device_type": "LAP-C201S",
+        "connection_status": "online",
+        "current_firm_version": "1.0",
+    }
+)
+
+
 def _make_purifier_device(**state_overrides):
     """Return a mock purifier device with customizable state attributes."""
-    device = MagicMock()
-    device.cid = "purifier-cid"
-    device.sub_device_no = None
-    device.device_name = "Purifier"
-    device.device_type = "LAP-C201S"
-    device.connection_status = "online"
-    device.current_firm_version = "1.0"
-    # Use spec=[] so only explicitly set attributes exist on state
-    state = MagicMock(spec=[])
-    for k, v in state_overrides.items():
-        setattr(state, k, v)
-    device.state = state
-    return device
+    # A plain namespace so only explicitly set attributes exist on state
+    return _make_mock(_PURIFIER_ATTRS, state=SimpleNamespace(**state_overrides))
 
 
 # ---------------------------------------------------------------------------
@@ -59,10 +66,10 @@ def _make_purifier_device(**state_overrides):
 class TestVeSyncPowerSensor:
     """Tests for VeSyncPowerSensor."""
 
-    @pytest.fixture
-    def power_sensor(self, mock_outlet_device, mock_coordinator):
+    @pytest.fixture(scope="class")
+    def power_sensor(self, class_outlet_device, mock_coordinator):
         """Return a power sensor entity."""
-        return VeSyncPowerSensor(mock_outlet_device, mock_coordinator)
+        return VeSyncPowerSensor(class_outlet_device, mock_coordinator)
 
     def test_unique_id_suffix(self, power_sensor):
         """Append -power to unique_id."""
@@ -76,7 +83,7 @@ class TestVeSyncPowerSensor:
         """Return POWER device class."""
         assert power_sensor.device_class == SensorDeviceClass.POWER
 
-    def test_native_value(self, power_sensor, mock_outlet_device):
+    def test_native_value(self, power_sensor):
         """Return current power value."""
         assert power_sensor.native_value == 15.5
 
@@ -92,10 +99,10 @@ class TestVeSyncPowerSensor:
 class TestVeSyncEnergySensor:
     """Tests for VeSyncEnergySensor."""
 
-    @pytest.fixture
-    def energy_sensor(self, mock_outlet_device, mock_coordinator):
+    @pytest.fixture(scope="class")
+    def energy_sensor(self, class_outlet_device, mock_coordinator):
         """Return an energy sensor entity."""
-        return VeSyncEnergySensor(mock_outlet_device, mock_coordinator)
+        return VeSyncEnergySensor(class_outlet_device, mock_coordinator)
 
     def test_unique_id_suffix(self, energy_sensor):
         """Append -energy to unique_id."""
@@ -109,7 +116,7 @@ class TestVeSyncEnergySensor:
         """Return ENERGY device class."""
         assert energy_sensor.device_class == SensorDeviceClass.ENERGY
 
-    def test_native_value(self, energy_sensor, mock_outlet_device):
+    def test_native_value(self, energy_sensor):
         """Return today's energy usage."""
         assert energy_sensor.native_value == 1.2
 
@@ -232,15 +239,18 @@ class TestVeSyncFilterLifeSensor:
 # Airfryer sensor tests
 # ---------------------------------------------------------------------------
 
+_AIRFRYER_TEMP_TYPE = SENSOR_TYPES_AIRFRYER["current_temp"]
+
 
 class TestVeSyncAirfryerSensor:
     """Tests for VeSyncairfryerSensor."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def airfryer_temp_sensor(self, mock_airfryer_device, mock_coordinator):
         """Return an airfryer temperature sensor."""
-        stype = SENSOR_TYPES_AIRFRYER["current_temp"]
-        return VeSyncairfryerSensor(mock_airfryer_device, mock_coordinator, stype)
+        return VeSyncairfryerSensor(
+            mock_airfryer_device, mock_coordinator, _AIRFRYER_TEMP_TYPE
+        )
 
     def test_unique_id_suffix(self, airfryer_temp_sensor):
         """Include sensor type in unique_id."""
@@ -260,26 +270,15 @@ class TestVeSyncAirfryerSensor:
 # ---------------------------------------------------------------------------
 
 
-class TestVeSyncPowerSensorUpdate:
-    """Tests for VeSyncPowerSensor.update."""
-
-    async def test_update_calls_device_methods(self, mock_outlet_device, mock_coordinator):
-        """Call update and update_energy on the underlying device."""
-        sensor = VeSyncPowerSensor(mock_outlet_device, mock_coordinator)
-        await sensor.async_update()
-        mock_outlet_device.update.assert_called_once()
-        mock_outlet_device.update_energy.assert_called_once()
-
-
-class TestVeSyncEnergySensorUpdate:
-    """Tests for VeSyncEnergySensor.update."""
-
-    async def test_update_calls_device_methods(self, mock_outlet_device, mock_coordinator):
-        """Call update and update_energy on the underlying device."""
-        sensor = VeSyncEnergySensor(mock_outlet_device, mock_coordinator)
-        await sensor.async_update()
-        mock_outlet_device.update.assert_called_once()
-        mock_outlet_device.update_energy.assert_called_once()
+@pytest.mark.parametrize("sensor_cls", [VeSyncPowerSensor, VeSyncEnergySensor])
+async def test_update_calls_device_methods(
+    sensor_cls, mock_outlet_device, mock_coordinator
+):
+    """Call update and update_energy on the underlying device."""
+    sensor = sensor_cls(mock_outlet_device, mock_coordinator)
+    await sensor.async_update()
+    mock_outlet_device.update.assert_called_once()
+    mock_outlet_device.update_energy.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -347,104 +346,84 @@ class TestVeSyncAirQualityValueSensorEdgeCases:
 
 
 # ---------------------------------------------------------------------------
-# PM1 sensor tests
+# PM1 / PM10 sensor tests
 # ---------------------------------------------------------------------------
 
 
-class TestVeSyncPM1Sensor:
-    """Tests for VeSyncPM1Sensor."""
-
-    @pytest.fixture
-    def pm1_sensor(self, mock_coordinator):
-        """Return a PM1 sensor entity."""
-        device = _make_purifier_device(pm1=8)
-        return VeSyncPM1Sensor(device, mock_coordinator)
-
-    def test_unique_id_suffix(self, pm1_sensor):
-        """Append -pm1 to unique_id."""
-        assert pm1_sensor.unique_id.endswith("-pm1")
-
-    def test_name_suffix(self, pm1_sensor):
-        """Include 'PM1' in name."""
-        assert "PM1" in pm1_sensor.name
-
-    def test_native_value(self, pm1_sensor):
-        """Return PM1 value."""
-        assert pm1_sensor.native_value == 8
-
-    def test_device_class(self, pm1_sensor):
-        """Return PM1 device class."""
-        assert pm1_sensor.device_class == SensorDeviceClass.PM1
-
-    def test_unit(self, pm1_sensor):
-        """Return ug/m3 unit."""
-        assert pm1_sensor.native_unit_of_measurement == CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
-
-    def test_state_class(self, pm1_sensor):
-        """Return MEASUREMENT state class."""
-        assert pm1_sensor.state_class == SensorStateClass.MEASUREMENT
-
-    def test_non_numeric_returns_none(self, mock_coordinator):
-        """Return None for non-numeric pm1 values."""
-        device = _make_purifier_device(pm1="low")
-        sensor = VeSyncPM1Sensor(device, mock_coordinator)
-        assert sensor.native_value is None
-
-    def test_missing_key_returns_none(self, mock_coordinator):
-        """Return None when pm1 key is missing."""
-        device = _make_purifier_device()
-        sensor = VeSyncPM1Sensor(device, mock_coordinator)
-        assert sensor.native_value is None
-
+class _PMCase(NamedTuple):
+    """Expected behaviour of one particulate matter sensor."""
+
+    sensor_cls: type
+    key: str
+    suffix: str
+    name: str
+    device_class: SensorDeviceClass
+    value: int
+    bad_value: str
+
+
+_PM_CASES = (
+    _PMCase(VeSyncPM1Sensor, "pm1", "-pm1", "PM1", SensorDeviceClass.PM1, 8, "low"),
+    _PMCase(
+        VeSyncPM10Sensor,
+        "pm10",
+        "-pm10",
+        "PM10",
+        SensorDeviceClass.PM10,
+        22,
+        "moderate",
+    ),
+)
 
-# ---------------------------------------------------------------------------
-# PM10 sensor tests
-# ---------------------------------------------------------------------------
 
+class TestVeSyncPMSensor:
+    """Tests for VeSyncPM1Sensor and VeSyncPM10Sensor."""
 
-class TestVeSyncPM10Sensor:
-    """Tests for VeSyncPM10Sensor."""
+    @pytest.fixture(params=_PM_CASES, ids=lambda case: case.key)
+    def case(self, request):
+        """Return the expectations for one PM sensor."""
+        return request.param
 
     @pytest.fixture
-    def pm10_sensor(self, mock_coordinator):
-        """Return a PM10 sensor entity."""
-        device = _make_purifier_device(pm10=22)
-        return VeSyncPM10Sensor(device, mock_coordinator)
+    def pm_sensor(self, case, mock_coordinator):
+        """Return a PM sensor entity."""
+        device = _make_purifier_device(**{case.key: case.value})
+        return case.sensor_cls(device, mock_coordinator)
 
-    def test_unique_id_suffix(self, pm10_sensor):
-        """Append -pm10 to unique_id."""
-        assert pm10_sensor.unique_id.endswith("-pm10")
+    def test_unique_id_suffix(self, case, pm_sensor):
+        """Append the PM suffix to unique_id."""
+        assert pm_sensor.unique_id.endswith(case.suffix)
 
-    def test_name_suffix(self, pm10_sensor):
-        """Include 'PM10' in name."""
-        assert "PM10" in pm10_sensor.name
+    def test_name_suffix(self, case, pm_sensor):
+        """Include the PM size in name."""
+        assert case.name in pm_sensor.name
 
-    def test_native_value(self, pm10_sensor):
-        """Return PM10 value."""
-        assert pm10_sensor.native_value == 22
+    def test_native_value(self, case, pm_sensor):
+        """Return the PM value."""
+        assert pm_sensor.native_value == case.value
 
-    def test_device_class(self, pm10_sensor):
-        """Return PM10 device class."""
-        assert pm10_sensor.device_class == SensorDeviceClass.PM10
+    def test_device_class(self, case, pm_sensor):
+        """Return the matching PM device class."""
+        assert pm_sensor.device_class == case.device_class
 
-    def test_unit(self, pm10_sensor):
+    def test_unit(self, pm_sensor):
         """Return ug/m3 unit."""
-        assert pm10_sensor.native_unit_of_measurement == CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
+        assert pm_sensor.native_unit_of_measurement == CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
 
-    def test_state_class(self, pm10_sensor):
+    def test_state_class(self, pm_sensor):
         """Return MEASUREMENT state class."""
-        assert pm10_sensor.state_class == SensorStateClass.MEASUREMENT
+        assert pm_sensor.state_class == SensorStateClass.MEASUREMENT
 
-    def test_non_numeric_returns_none(self, mock_coordinator):
-        """Return None for non-numeric pm10 values."""
-        device = _make_purifier_device(pm10="moderate")
-        sensor = VeSyncPM10Sensor(device, mock_coordinator)
+    def test_non_numeric_returns_none(self, case, mock_coordinator):
+        """Return None for non-numeric PM values."""
+        device = _make_purifier_device(**{case.key: case.bad_value})
+        sensor = case.sensor_cls(device, mock_coordinator)
         assert sensor.native_value is None
 
-    def test_missing_key_returns_none(self, mock_coordinator):
-        """Return None when pm10 key is missing."""
+    def test_missing_key_returns_none(self, case, mock_coordinator):
+        """Return None when the PM key is missing."""
         device = _make_purifier_device()
-        sensor = VeSyncPM10Sensor(device, mock_coordinator)
+        sensor = case.sensor_cls(device, mock_coordinator)
         assert sensor.native_value is None
 
 
@@ -513,8 +492,6 @@ class TestVeSyncFilterLifeSensorEdgeCases:
 
     def test_entity_category_diagnostic(self, mock_coordinator):
         """Return diagnostic entity category."""
-        from homeassistant.helpers.entity import EntityCategory
-
         device = _make_purifier_device(filter_life=80)
         sensor = VeSyncFilterLifeSensor(device, mock_coordinator)
         assert sensor.entity_category == EntityCategory.DIAGNOSTIC
@@ -569,15 +546,11 @@ class TestVeSyncOutletSensorEntityCategory:
 
     def test_power_sensor_entity_category(self, mock_outlet_device, mock_coordinator):
         """Return diagnostic entity category for outlet sensors."""
-        from homeassistant.helpers.entity import EntityCategory
-
         sensor = VeSyncPowerSensor(mock_outlet_device, mock_coordinator)
         assert sensor.entity_category == EntityCategory.DIAGNOSTIC
 
     def test_energy_sensor_entity_category(self, mock_outlet_device, mock_coordinator):
         """Return diagnostic entity category for energy sensors."""
-        from homeassistant.helpers.entity import EntityCategory
-
         sensor = VeSyncEnergySensor(mock_outlet_device, mock_coordinator)
         assert sensor.entity_category == EntityCategory.DIAGNOSTIC
 
@@ -1,6 +1,8 @@
 """Tests for VeSync switch platform."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import NamedTuple
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -14,6 +16,8 @@ from custom_components.vesync.switch import (
     VeSyncSwitchHA,
 )
 
+from .conftest import _base_device_attrs, _make_mock
+
 
 # ---------------------------------------------------------------------------
 # VeSyncBaseSwitch / VeSyncSwitchHA tests
@@ -28,16 +32,6 @@ class TestVeSyncSwitchHA:
         """Return a VeSyncSwitchHA entity."""
         return VeSyncSwitchHA(mock_outlet_device, mock_coordinator)
 
-    async def test_turn_on(self, switch_entity, mock_outlet_device):
-        """Delegate turn_on to the device."""
-        await switch_entity.async_turn_on()
-        mock_outlet_device.turn_on.assert_called_once()
-
-    async def test_turn_off(self, switch_entity, mock_outlet_device):
-        """Delegate turn_off to the device."""
-        await switch_entity.async_turn_off()
-        mock_outlet_device.turn_off.assert_called_once()
-
     def test_extra_state_attributes_with_energy(self, switch_entity, mock_outlet_device):
         """Return energy attributes when available."""
         attrs = switch_entity.extra_state_attributes
@@ -48,15 +42,15 @@ class TestVeSyncSwitchHA:
 
     def test_extra_state_attributes_without_energy(self, mock_coordinator):
         """Return empty dict when energy info unavailable."""
-        device = MagicMock()
-        device.device_name = "NoEnergyOutlet"
-        device.device_type = "ESW15-USA"
-        device.cid = "test-cid"
-        device.sub_device_no = None
-        device.connection_status = "online"
-        device.current_firm_version = "1.0"
-        state = MagicMock(spec=[])
-        device.state = state
+        device = _make_mock(
+            _base_device_attrs(
+                device_name="NoEnergyOutlet",
+                device_type="ESW15-USA",
+                cid="test-cid",
+                current_firm_version="1.0",
+            ),
+            state=SimpleNamespace(),
+        )
 
         switch = VeSyncSwitchHA(device, mock_coordinator)
         assert switch.extra_state_attributes == {}
@@ -68,14 +62,66 @@ class TestVeSyncSwitchHA:
         mock_outlet_device.update_energy.assert_called_once()
 
 
-class TestVeSyncLightSwitch:
-    """Tests for VeSyncLightSwitch entity."""
+# Single-call delegations: (entity class, device fixture, entity method,
+# device method).
+_DELEGATIONS = (
+    (VeSyncSwitchHA, "mock_outlet_device", "async_turn_on", "turn_on"),
+    (VeSyncSwitchHA, "mock_outlet_device", "async_turn_off", "turn_off"),
+    (VeSyncLightSwitch, "mock_wall_switch_device", "async_turn_on", "turn_on"),
+    (
+        VeSyncHumidifierAutoOnHA,
+        "mock_humidifier_device",
+        "async_turn_on",
+        "set_auto_mode",
+    ),
+)
 
-    async def test_turn_on(self, mock_wall_switch_device, mock_coordinator):
-        """Delegate turn_on to the device."""
-        switch = VeSyncLightSwitch(mock_wall_switch_device, mock_coordinator)
-        await switch.async_turn_on()
-        mock_wall_switch_device.turn_on.assert_called_once()
+
+@pytest.mark.parametrize(
+    ("entity_cls", "device_fixture", "entity_method", "device_method"),
+    _DELEGATIONS,
+    ids=lambda value: value if isinstance(value, str) else value.__name__,
+)
+async def test_delegates_to_device(
+    request, mock_coordinator, entity_cls, device_fixture, entity_method, device_method
+):
+    """Call the matching device method once."""
+    device = request.getfixturevalue(device_fixture)
+    entity = entity_cls(device, mock_coordinator)
+    await getattr(entity, entity_method)()
+    getattr(device, device_method).assert_called_once()
+
+
+# Switch commands that write the new state right away: (entity class, device
+# fixture, entity method).
+_STATE_WRITES = [
+    (entity_cls, device_fixture, entity_method)
+    for entity_cls, device_fixture in (
+        (VeSyncSwitchHA, "mock_outlet_device"),
+        (VeSyncLightSwitch, "mock_wall_switch_device"),
+        (VeSyncFanChildLockHA, "mock_humidifier_device"),
+        (VeSyncHumidifierDisplayHA, "mock_humidifier_device"),
+        (VeSyncHumidifierAutomaticStopHA, "mock_humidifier_device"),
+        (VeSyncHumidifierAutoOnHA, "mock_humidifier_device"),
+    )
+    for entity_method in ("async_turn_on", "async_turn_off")
+]
+
+
+@pytest.mark.parametrize(
+    ("entity_cls", "device_fixture", "entity_method"),
+    _STATE_WRITES,
+    ids=lambda value: value if isinstance(value, str) else value.__name__,
+)
+async def test_command_schedules_state_write(
+    request, mock_coordinator, entity_cls, device_fixture, entity_method
+):
+    """Schedule a state write after the device command."""
+    device = request.getfixturevalue(device_fixture)
+    entity = entity_cls(device, mock_coordinator)
+    with patch.object(entity, "schedule_update_ha_state") as mock_write:
+        await getattr(entity, entity_method)()
+    mock_write.assert_called_once_with()
 
 
 # ---------------------------------------------------------------------------
@@ -83,91 +129,83 @@ class TestVeSyncLightSwitch:
 # ---------------------------------------------------------------------------
 
 
-class TestVeSyncFanChildLockHA:
-    """Tests for child lock switch entity."""
-
-    @pytest.fixture
-    def child_lock_entity(self, mock_humidifier_device, mock_coordinator):
-        """Return a child lock entity."""
-        return VeSyncFanChildLockHA(mock_humidifier_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, child_lock_entity):
-        """Append -child-lock to unique_id."""
-        assert child_lock_entity.unique_id.endswith("-child-lock")
-
-    def test_name_suffix(self, child_lock_entity):
-        """Append 'child lock' to entity name."""
-        assert child_lock_entity.name.endswith("child lock")
-
-    def test_is_on(self, child_lock_entity, mock_humidifier_device):
-        """Return child_lock state from device state."""
-        mock_humidifier_device.state.child_lock = True
-        assert child_lock_entity.is_on is True
-
-    async def test_turn_on(self, child_lock_entity, mock_humidifier_device):
-        """Delegate to device.turn_on_child_lock."""
-        await child_lock_entity.async_turn_on()
-        mock_humidifier_device.turn_on_child_lock.assert_called_once()
+class _ToggleCase(NamedTuple):
+    """Expected behaviour of one on/off feature switch."""
+
+    entity_cls: type
+    suffix: str
+    state_attr: str
+    on_method: str
+    off_method: str
+
+
+_TOGGLE_CASES = (
+    _ToggleCase(
+        VeSyncFanChildLockHA,
+        "-child-lock",
+        "child_lock",
+        "turn_on_child_lock",
+        "turn_off_child_lock",
+    ),
+    _ToggleCase(
+        VeSyncHumidifierDisplayHA,
+        "-display",
+        "display_status",
+        "turn_on_display",
+        "turn_off_display",
+    ),
+    _ToggleCase(
+        VeSyncHumidifierAutomaticStopHA,
+        "-automatic-stop",
+        "automatic_stop",
+        "turn_on_automatic_stop",
+        "turn_off_automatic_stop",
+    ),
+)
 
-    async def test_turn_off(self, child_lock_entity, mock_humidifier_device):
-        """Delegate to device.turn_off_child_lock."""
-        await child_lock_entity.async_turn_off()
-        mock_humidifier_device.turn_off_child_lock.assert_called_once()
 
+class TestVeSyncToggleSwitches:
+    """Tests shared by the child lock, display and automatic stop switches."""
 
-class TestVeSyncHumidifierDisplayHA:
-    """Tests for display toggle switch entity."""
+    @pytest.fixture(params=_TOGGLE_CASES, ids=lambda case: case.entity_cls.__name__)
+    def case(self, request):
+        """Return the expectations for one feature switch."""
+        return request.param
 
     @pytest.fixture
-    def display_entity(self, mock_humidifier_device, mock_coordinator):
-        """Return a display switch entity."""
-        return VeSyncHumidifierDisplayHA(mock_humidifier_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, display_entity):
-        """Append -display to unique_id."""
-        assert display_entity.unique_id.endswith("-display")
-
-    def test_is_on(self, display_entity, mock_humidifier_device):
-        """Return display state from device state."""
-        mock_humidifier_device.state.display_status = True
-        assert display_entity.is_on is True
-
-    async def test_turn_on(self, display_entity, mock_humidifier_device):
-        """Delegate to device.turn_on_display."""
-        await display_entity.async_turn_on()
-        mock_humidifier_device.turn_on_display.assert_called_once()
+    def toggle_entity(self, case, mock_humidifier_device, mock_coordinator):
+        """Return the feature switch under test."""
+        return case.entity_cls(mock_humidifier_device, mock_coordinator)
 
-    async def test_turn_off(self, display_entity, mock_humidifier_device):
-        """Delegate to device.turn_off_display."""
-        await display_entity.async_turn_off()
-        mock_humidifier_device.turn_off_display.assert_called_once()
+    def test_unique_id_suffix(self, case, toggle_entity):
+        """Append the feature suffix to unique_id."""
+        assert toggle_entity.unique_id.endswith(case.suffix)
 
+    def test_is_on(self, case, toggle_entity, mock_humidifier_device):
+        """Return the feature state from device state."""
+        setattr(mock_humidifier_device.state, case.state_attr, True)
+        assert toggle_entity.is_on is True
 
-class TestVeSyncHumidifierAutomaticStopHA:
-    """Tests for automatic stop switch entity."""
+    async def test_turn_on(self, case, toggle_entity, mock_humidifier_device):
+        """Delegate to the device's turn-on method."""
+        await toggle_entity.async_turn_on()
+        getattr(mock_humidifier_device, case.on_method).assert_called_once()
 
-    @pytest.fixture
-    def auto_stop_entity(self, mock_humidifier_device, mock_coordinator):
-        """Return an automatic stop entity."""
-        return VeSyncHumidifierAutomaticStopHA(mock_humidifier_device, mock_coordinator)
-
-    def test_unique_id_suffix(self, auto_stop_entity):
-        """Append -automatic-stop to unique_id."""
-        assert auto_stop_entity.unique_id.endswith("-automatic-stop")
+    async def test_turn_off(self, case, toggle_entity, mock_humidifier_device):
+        """Delegate to the device's turn-off method."""
+        await toggle_entity.async_turn_off()
+        getattr(mock_humidifier_device, case.off_method).assert_called_once()
 
-    def test_is_on(self, auto_stop_entity, mock_humidifier_device):
-        """Return automatic_stop state from device config."""
-        assert auto_stop_entity.is_on is True
 
-    async def test_turn_on(self, auto_stop_entity, mock_humidifier_device):
-        """Delegate to device.turn_on_automatic_stop."""
-        await auto_stop_entity.async_turn_on()
-        mock_humidifier_device.turn_on_automatic_stop.assert_called_once()
+class TestVeSyncFanChildLockHA:
+    """Tests for child lock switch entity."""
 
-    async def test_turn_off(self, auto_stop_entity, mock_humidifier_device):
-        """Delegate to device.turn_off_automatic_stop."""
-        await auto_stop_entity.async_turn_off()
-        mock_humidifier_device.turn_off_automatic_stop.assert_called_once()
+    def test_name_suffix(self, mock_humidifier_device, mock_coordinator):
+        """Append 'child lock' to entity name."""
+        child_lock_entity = VeSyncFanChildLockHA(
+            mock_humidifier_device, mock_coordinator
+        )
+        assert child_lock_entity.name.endswith("child lock")
 
 
 class TestVeSyncHumidifierAutoOnHA:
@@ -192,11 +230,6 @@ class TestVeSyncHumidifierAutoOnHA:
         mock_humidifier_device.state.mode = "manual"
         assert auto_mode_entity.is_on is False
 
-    async def test_turn_on(self, auto_mode_entity, mock_humidifier_device):
-        """Delegate to device.set_auto_mode."""
-        await auto_mode_entity.async_turn_on()
-        mock_humidifier_device.set_auto_mode.assert_called_once()
-
     async def test_turn_off(self, auto_mode_entity, mock_humidifier_device):
         """Set manual mode and mist level 1."""
         await auto_mode_entity.async_turn_off()